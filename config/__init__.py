@@ -5,6 +5,7 @@ from config.settings import (
     VisualizationConfig,
     ReportingConfig,
     PipelineConfig,
+    default_pipeline_config,
 )
 
 __all__ = [
@@ -13,4 +14,5 @@ __all__ = [
     "VisualizationConfig",
     "ReportingConfig",
     "PipelineConfig",
+    "default_pipeline_config",
 ]
@@ -4,6 +4,8 @@ Merkezi Konfigürasyon Modülü
 Tüm sistem ayarları burada dataclass olarak tanımlanır.
 Immutable (frozen) dataclass'lar kullanılarak ayarların çalışma zamanında
 değiştirilmesi engellenir — bu "yapılandırma kararlılığı" sağlar.
+Tüm config sınıfları slots=True ile tanımlanır: instance başına __dict__
+oluşturulmaz, bellek azalır ve attribute erişimi slot üzerinden yapılır.
 
 Mimari notu:
     Tüm bileşenler (dedektör, preprocessor, visualizer vb.) kendi
@@ -18,6 +20,7 @@ Sınıf hiyerarşisi:
     └── ReportingConfig      — Raporlama ve frame örnekleme
 """
 
+import functools
 from dataclasses import dataclass, field
 from typing import Tuple
 
@@ -25,7 +28,7 @@ from typing import Tuple
 # =============================================================================
 # TESPİT KONFİGÜRASYONU
 # =============================================================================
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DetectionConfig:
     """
     HOG + SVM tespit parametreleri.
@@ -66,6 +69,12 @@ class DetectionConfig:
     #   0.4 → %40'tan fazla çakışan kutular birleştirilir.
     nms_threshold: float = 0.4
 
+    # nms_method: NMS algoritması.
+    #   "greedy" → klasik greedy NMS (numba çekirdeği veya cv2.dnn.NMSBoxes)
+    #   "fast"   → vektörel Fast NMS (saf numpy, IoU matrisi). Kalabalık
+    #              sahnelerde greedy'den biraz daha agresif bastırabilir.
+    nms_method: str = "greedy"
+
     # --- Boyut Filtreleri ---
     # min_detection_size: Minimum bounding box boyutu (genişlik, yükseklik) piksel.
     #   Çok küçük tespitler genellikle gürültüdür.
@@ -101,11 +110,57 @@ class DetectionConfig:
     second_pass_padding: Tuple[int, int] = (16, 16)     # Daha geniş dolgu
     second_pass_hit_threshold: float = 0.3               # Daha düşük eşik
 
+    # multi_pass_skip_threshold: Birinci geçiş en az bu kadar tespit
+    #   bulduysa ikinci geçiş atlanır. Kalabalık karede birinci geçiş zaten
+    #   yeterli sonuç vermiştir; ikinci tarama maliyeti ikiye katlar.
+    #   0 → ikinci geçiş her zaman çalışır.
+    multi_pass_skip_threshold: int = 8
+
+    # multi_pass_merge_scale_delta: İki geçişin piramit ölçekleri bu farktan
+    #   yakınsa (|scale - second_pass_scale| < delta) iki ayrı tarama yerine
+    #   tek bir birleşik tarama yapılır: ince ölçek, ince adım, geniş dolgu ve
+    #   düşük eşik. Gradyan piramidi iki kez yerine bir kez hesaplanır.
+    #   Sonuçlar iki geçişle birebir aynı değildir (gruplama farklı çalışır),
+    #   bu yüzden varsayılan kapalıdır. 0.0 → birleştirme yok.
+    multi_pass_merge_scale_delta: float = 0.0
+
+    # parallel_multi_pass: True ise iki geçiş aynı kare üzerinde eş zamanlı
+    #   (ayrı descriptor'larla, ayrı thread'lerde) çalıştırılır. Gecikme
+    #   t1 + t2 yerine max(t1, t2)'ye yaklaşır; çok çekirdekli CPU'larda
+    #   faydalıdır. İkinci geçiş birinciyi beklemediği için
+    #   multi_pass_skip_threshold bu modda uygulanmaz.
+    parallel_multi_pass: bool = False
+
+    # --- Şerit (Stripe) Paralelliği ---
+    # stripe_min_height: >0 ise yüksekliği bu değere ulaşan kareler yatay
+    #   şeritlere bölünür; her şerit thread havuzunda ayrı bir descriptor ile
+    #   taranır. Şeritler max_detection_size yüksekliği kadar örtüşür —
+    #   post-processing'den geçebilecek her kutu en az bir şeridin içinde
+    #   kalır. Tek thread'li OpenCV derlemelerinde ve yüksek çözünürlükte
+    #   faydalıdır; şerit sınırlarında gruplama farklı çalışabileceğinden
+    #   sonuçlar tek taramayla birebir aynı olmayabilir. 0 → kapalı.
+    #   NOT: parallel_multi_pass ile birlikte kullanılmaz (havuz paylaşılır).
+    stripe_min_height: int = 0
+
+    # --- GPU (CUDA) Arka Ucu ---
+    # use_cuda: True ise initialize() sırasında CUDA destekli bir GPU aranır
+    #   ve cv2.cuda.HOG kullanılır. OpenCV CUDA desteğiyle derlenmemişse
+    #   veya GPU bulunamazsa uyarı verilip CPU dedektörüne dönülür.
+    #   NOT: CUDA HOG padding parametresini desteklemez (yok sayılır).
+    use_cuda: bool = False
+
+    # --- OpenCV Thread Havuzu ---
+    # opencv_threads: 0 → tüm çekirdekler (configure_opencv varsayılanı).
+    #   N > 0 → initialize() sırasında cv2.setNumThreads(N) çağrılır. Havuz
+    #   süreç genelidir (ön-işleme de etkilenir). Aynı makinede başka iş
+    #   yükleri varsa aşırı aboneliği önlemek için küçültülebilir.
+    opencv_threads: int = 0
+
 
 # =============================================================================
 # ÖN-İŞLEME KONFİGÜRASYONU
 # =============================================================================
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PreprocessConfig:
     """
     Görüntü ön-işleme parametreleri.
@@ -121,8 +176,15 @@ class PreprocessConfig:
     #   640 → hız/doğruluk dengesi için optimal.
     target_width: int = 640
 
-    # convert_to_gray: True ise son adımda gri tonlamaya dönüştürür.
-    #   HOG renkli veya gri görüntüde çalışabilir.
+    # pyramid_downscale: True ise 2 kattan FAZLA küçültmede (ör. 1080p → 640)
+    #   önce cv2.pyrDown ile yarıya inilir, kalan oran INTER_LINEAR ile
+    #   tamamlanır. 1920 → 640 BGR: ~1.1 ms (INTER_AREA ~1.6 ms).
+    #   Sonuç INTER_AREA ile birebir aynı değildir (Gaussian piramit).
+    pyramid_downscale: bool = False
+
+    # convert_to_gray: True ise çıktı gri tonlamadır.
+    #   HOG renkli veya gri görüntüde çalışabilir. Gri dönüşüm resize'dan
+    #   hemen sonra yapılır; CLAHE doğrudan gri kanala uygulanır (LAB yok).
     convert_to_gray: bool = False
 
     # --- CLAHE (Contrast Limited Adaptive Histogram Equalization) ---
@@ -131,6 +193,12 @@ class PreprocessConfig:
     enable_clahe: bool = True
     clahe_clip_limit: float = 2.5           # Kontrast sınırlama değeri
     clahe_grid_size: Tuple[int, int] = (8, 8)  # Bölge ızgarası boyutu
+    # clahe_color_space: Renkli zincirde CLAHE'nin uygulandığı uzay.
+    #   "lab"   → L kanalı (varsayılan, algısal olarak en doğru)
+    #   "ycrcb" → Y (luma) kanalı; doğrusal dönüşüm, LAB'ın piksel başına
+    #             küp kökü hesabı yoktur — dönüşümler ~3 kat hızlı.
+    #             Sonuç LAB ile birebir aynı değildir.
+    clahe_color_space: str = "lab"
 
     # --- Keskinleştirme (Unsharp Mask) ---
     # Bulanık video karelerindeki kenar bilgisini güçlendirir.
@@ -144,11 +212,25 @@ class PreprocessConfig:
     enable_denoising: bool = True
     denoise_strength: int = 3  # GaussianBlur kernel boyutu (tek sayı olmalı)
 
+    # --- GPU (CUDA) Arka Ucu ---
+    # use_cuda: True ise tüm zincir (resize → denoise → CLAHE → sharpen)
+    #   cv2.cuda ile GPU belleğinde tek bir stream üzerinde çalışır; kare
+    #   bir kez yüklenir, sonuç bir kez indirilir. OpenCV CUDA desteğiyle
+    #   derlenmemişse veya GPU bulunamazsa uyarı verilip CPU'ya dönülür.
+    #   NOT: pyramid_downscale GPU yolunda kullanılmaz.
+    use_cuda: bool = False
+
+    # use_opencl: True ise zincir OpenCV T-API (cv2.UMat) ile çalışır;
+    #   OpenCL cihazı (entegre GPU, APU vb.) varsa işlemler ona aktarılır.
+    #   CUDA gerektirmez. OpenCL yoksa uyarı verilip CPU'ya dönülür.
+    #   use_cuda ile birlikte verilirse CUDA önceliklidir.
+    use_opencl: bool = False
+
 
 # =============================================================================
 # GÖRSELLEŞTİRME KONFİGÜRASYONU
 # =============================================================================
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class VisualizationConfig:
     """
     Görselleştirme (çizim ve panel) parametreleri.
@@ -167,12 +249,15 @@ class VisualizationConfig:
     show_info_panel: bool = True                        # FPS/tespit sayısı panelini göster
     save_output: bool = False                           # Çıktı videosunu kaydet
     output_path: str = "output/result.avi"              # Çıktı dosya yolu
+    # threaded_writer: True ise kareler arka plan thread'inde kodlanır
+    #   (ThreadedVideoWriter) — kodlama sonraki karenin işlenmesiyle örtüşür.
+    threaded_writer: bool = False
 
 
 # =============================================================================
 # RAPORLAMA KONFİGÜRASYONU
 # =============================================================================
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReportingConfig:
     """
     Loglama, raporlama ve frame örnekleme parametreleri.
@@ -190,19 +275,24 @@ class ReportingConfig:
     save_raw_frames: bool = False            # Çizimsiz orijinal kareyi de kaydet
     high_confidence_threshold: float = 1.5   # Bu güvenin üstündeki tespitlerde
                                              # interval'e bakmadan hemen kaydet
+    # threaded_sampling: True ise örnek kareler (JPEG) arka plan thread'inde
+    #   yazılır — disk I/O ana döngüyü bekletmez. Kaydedilen kareler aynıdır.
+    threaded_sampling: bool = False
 
 
 # =============================================================================
 # ANA PİPELINE KONFİGÜRASYONU
 # =============================================================================
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PipelineConfig:
     """
     Pipeline genel konfigürasyonu.
 
     Tüm alt konfigürasyonları bir araya getirir.
-    NOT: Bu sınıf frozen DEĞİL — çünkü çalışma zamanında
-    bileşenler tarafından okunması gerekir.
+    Alt konfigürasyonlar gibi bu sınıf da frozen'dır — bileşenler
+    config değerlerini constructor'da bir kez okuyup önbelleğe alabilir,
+    çalışma sırasında değişmeyeceklerinden emin olabilirler.
+    slots=True → attribute erişimi __dict__ yerine slot üzerinden yapılır.
     """
 
     # Alt konfigürasyonlar — her biri kendi varsayılanlarıyla başlar
@@ -211,8 +301,44 @@ class PipelineConfig:
     visualization: VisualizationConfig = field(default_factory=VisualizationConfig)
     reporting: ReportingConfig = field(default_factory=ReportingConfig)
 
+    # Sonuç penceresi gösterilsin mi? False → başsız (headless) çalışma:
+    # imshow/waitKey çağrılmaz; çıktı kaydı ve frame örneklemesi de
+    # kapalıysa çizim (Visualizer.draw) tamamen atlanır
+    show_display: bool = True
+
+    # Kare okuma + ön-işleme arka plan thread'inde mi yapılsın? True ise
+    # bir sonraki kare hazırlanırken ana thread mevcut karede tespit yapar
+    # (çok çekirdekte ön-işleme süresi tespitle örtüşür; sonuçlar aynıdır)
+    threaded_preprocess: bool = False
+
+    # Kaç karede bir tespit yapılsın? 1 → her kare. N → her N. kare işlenir,
+    # aradaki N-1 kare grab() ile çözülmeden atlanır (kaynak FPS'i tespit
+    # hızından çok yüksekse çözme maliyeti boşa harcanmaz)
+    frame_stride: int = 1
+
+    # Kaç ön-işlenmiş kare birlikte tespite verilsin? 1 → kare kare.
+    # K > 1 → K kare HOGDetector.detect_batch ile thread havuzunda paralel
+    # işlenir (çok çekirdekte verim artar; çizim/gösterim K kare gecikir).
+    # Tespitler kare kare çalışmayla aynıdır.
+    detect_batch_size: int = 1
+
     # Pencere adı — cv2.imshow tarafından kullanılır
     display_window_name: str = "Yaya Tespit Sistemi"
 
     # Çıkış tuşu — bu tuşa basıldığında pipeline durur
     quit_key: str = "q"
+
+
+@functools.lru_cache(maxsize=1)
+def default_pipeline_config() -> PipelineConfig:
+    """
+    Varsayılan PipelineConfig nesnesini döndürür (tek, paylaşılan örnek).
+
+    Tüm config sınıfları frozen olduğundan varsayılan örnek güvenle
+    paylaşılabilir — varsayılan ayarlara ihtiyaç duyan her çağıran
+    aynı nesneyi alır, alt config'ler tekrar tekrar oluşturulmaz.
+
+    Returns:
+        Önbelleğe alınmış varsayılan PipelineConfig.
+    """
+    return PipelineConfig()
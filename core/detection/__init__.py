@@ -1,4 +1,4 @@
-from core.detection.base_detector import BaseDetector, Detection
+from core.detection.base_detector import BaseDetector, Detection, DetectionBatch
 from core.detection.hog_detector import HOGDetector
 
-__all__ = ["BaseDetector", "Detection", "HOGDetector"]
+__all__ = ["BaseDetector", "Detection", "DetectionBatch", "HOGDetector"]
@@ -3,10 +3,13 @@ Soyut Tespit Motoru Arayüzü
 =============================
 Template Method Pattern ile tespit algoritması iskeleti tanımlar.
 
-Bu modül iki temel yapı sunar:
+Bu modül üç temel yapı sunar:
     1. Detection (dataclass): Tek bir tespitin bilgilerini taşır
        (konum, boyut, güven skoru).
-    2. BaseDetector (ABC): Tüm dedektörlerin uygulaması gereken
+    2. DetectionBatch (dataclass): Bir karedeki tüm tespitleri
+       SoA (Structure of Arrays) düzeninde numpy dizileri olarak taşır.
+       Filtreleme ve NMS bu diziler üzerinde vektörel yapılır.
+    3. BaseDetector (ABC): Tüm dedektörlerin uygulaması gereken
        soyut arayüz. Yeni bir tespit algoritması eklendiğinde
        bu sınıftan türetilmelidir.
 
@@ -16,9 +19,13 @@ Tasarım Prensibi:
     mevcut kod değiştirilmez.
 """
 
+import warnings
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import List
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from itertools import chain
+from operator import attrgetter
+from typing import Iterator, List, Tuple
 
 import numpy as np
 
@@ -26,11 +33,21 @@ import numpy as np
 # =============================================================================
 # TESPİT VERİ SINIFI
 # =============================================================================
-@dataclass
+@dataclass(slots=True, frozen=True, eq=True)
 class Detection:
     """
     Tek bir tespit sonucunu temsil eder (bounding box + güven skoru).
 
+    Performans notu:
+        slots=True → instance başına __dict__ oluşturulmaz; bellek
+        yaklaşık yarıya iner ve alan erişimi (det.x, det.confidence)
+        sözlük araması yerine slot okuması olur. Her karede yüzlerce
+        Detection üretildiği için bu fark NMS/ölçekleme döngülerinde hissedilir.
+
+        frozen=True + eq=True → otomatik __hash__ üretilir; tespitler
+        set/dict içinde (tekilleştirme vb.) saklanabilir. Alan değiştirmek
+        gerekirse dataclasses.replace(det, x=...) kullanılmalıdır.
+
     Attributes:
         x: Bounding box sol üst köşe X koordinatı (piksel).
         y: Bounding box sol üst köşe Y koordinatı (piksel).
@@ -47,21 +64,23 @@ class Detection:
     h: int          # Yükseklik
     confidence: float  # SVM güven skoru
 
-    @property
-    def area(self) -> int:
-        """
-        Bounding box alanını döndürür.
-        NMS gibi algoritmalarda IoU hesaplaması için kullanılır.
-        """
-        return self.w * self.h
+    # --- Türetilmiş alanlar (__post_init__ içinde bir kez hesaplanır) ---
+    # area: Bounding box alanı — NMS gibi algoritmalarda IoU hesaplaması için.
+    # center: Bounding box merkez noktası — takip (tracking) algoritmalarında
+    #   nesne konumunu belirlemek için.
+    # Detection frozen olduğundan bu değerler hiç değişmez; her erişimde
+    # yeniden hesaplamak yerine nesne oluşturulurken saklanır.
+    # cached_property __dict__ gerektirdiği için (slots=True ile uyumsuz)
+    # init=False alanlar kullanılır; eşitlik/hash hesabına katılmazlar.
+    area: int = field(init=False, repr=False, compare=False)
+    center: Tuple[int, int] = field(init=False, repr=False, compare=False)
 
-    @property
-    def center(self) -> tuple[int, int]:
-        """
-        Bounding box merkez noktasını döndürür.
-        Takip (tracking) algoritmalarında nesne konumunu belirlemek için kullanılır.
-        """
-        return (self.x + self.w // 2, self.y + self.h // 2)
+    def __post_init__(self) -> None:
+        """Türetilmiş alanları hesaplar (frozen sınıfta object.__setattr__ ile)."""
+        object.__setattr__(self, "area", self.w * self.h)
+        object.__setattr__(
+            self, "center", (self.x + self.w // 2, self.y + self.h // 2)
+        )
 
     def scale(self, factor: float) -> "Detection":
         """
@@ -76,21 +95,217 @@ class Detection:
             2 ile çarpılarak orijinal boyuta geri döner:
             x_orijinal = x_küçük / 0.5 = x_küçük * 2
 
+        NOT: Kullanımdan kaldırılacak (deprecated). Tüm kare için
+        DetectionBatch.scale() kullanılmalıdır; bu metot yalnızca eski
+        çağıranlar için korunur.
+
+        Performans notu:
+            1/factor bir kez hesaplanır ve dört koordinat çarpılır —
+            dört ayrı bölmeye göre daha ucuzdur. Tek kutu için numpy
+            dizisi oluşturmak bu hesaptan pahalı olduğundan skaler yapılır.
+
         Args:
             factor: Ölçekleme faktörü (0-1 arası küçültme).
 
         Returns:
             Ölçeklenmiş koordinatlara sahip yeni Detection nesnesi.
         """
+        warnings.warn(
+            "Detection.scale() kullanımdan kaldırılacak; "
+            "DetectionBatch.scale() kullanın.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        inv = 1.0 / factor  # DetectionBatch.scale_boxes ile aynı hesap
         return Detection(
-            x=int(self.x / factor),
-            y=int(self.y / factor),
-            w=int(self.w / factor),
-            h=int(self.h / factor),
+            x=int(self.x * inv),
+            y=int(self.y * inv),
+            w=int(self.w * inv),
+            h=int(self.h * inv),
             confidence=self.confidence,  # Güven skoru değişmez
         )
 
 
+# =============================================================================
+# TOPLU TESPİT VERİ SINIFI (SoA)
+# =============================================================================
+# Detection → dizi dönüşümünde kullanılan alan okuyucuları (bkz. from_detections)
+_BOX_FIELDS = attrgetter("x", "y", "w", "h")
+_CONFIDENCE = attrgetter("confidence")
+
+
+@dataclass(frozen=True, eq=False)
+class DetectionBatch(Sequence):
+    """
+    Bir karedeki tespitleri SoA (Structure of Arrays) düzeninde taşır.
+
+    Neden SoA?
+        - List[Detection] (AoS) düzeninde her tespit ayrı bir Python nesnesidir;
+          filtreleme her nesne için ayrı attribute okuması demektir
+        - SoA düzeninde tüm kutular tek bir (N, 4) dizide durur;
+          boyut/oran/güven filtreleri tek bir numpy maskesiyle yapılır
+        - detectMultiScale zaten numpy dizisi döndürür — ara nesne üretilmez
+
+    Geriye dönük uyumluluk:
+        Sınıf Sequence[Detection] arayüzünü uygular. batch[i], for döngüsü
+        ve len() çalışır; Detection nesneleri yalnızca erişildiğinde üretilir
+        (for döngüsünde tüm satırlar tek seferde to_list() ile üretilir).
+        Dilim / indeks dizisi (batch[:k]) eski listedeki gibi alt küme
+        döndürür (DetectionBatch olarak). == değer karşılaştırması yapar:
+        başka bir batch ile diziler, liste ile Detection'lar karşılaştırılır.
+
+    Attributes:
+        boxes: (N, 4) int32 dizi — her satır [x, y, w, h].
+        confidences: (N,) float64 dizi — her kutunun SVM güven skoru.
+    """
+
+    boxes: np.ndarray        # (N, 4) int32 — x, y, w, h
+    confidences: np.ndarray  # (N,) float64 — SVM güven skorları
+
+    @classmethod
+    def empty(cls) -> "DetectionBatch":
+        """Tespit içermeyen boş bir batch döndürür."""
+        return cls(
+            boxes=np.empty((0, 4), dtype=np.int32),
+            confidences=np.empty(0, dtype=np.float64),
+        )
+
+    @classmethod
+    def from_detections(cls, detections: Sequence[Detection]) -> "DetectionBatch":
+        """
+        Detection listesinden batch oluşturur.
+
+        Liste döndüren eski/harici dedektörlerin çıktısını
+        vektörel post-processing'e sokmak için kullanılır.
+        """
+        if isinstance(detections, DetectionBatch):
+            return detections
+        if not detections:
+            return cls.empty()
+        # attrgetter + np.fromiter: attribute okuma C seviyesindeki map
+        # döngüsünde yapılır ve doğrudan hedef dtype'a yazılır — ara
+        # Python listeleri (liste içinde liste) oluşturulmaz
+        n = len(detections)
+        return cls(
+            boxes=np.fromiter(
+                chain.from_iterable(map(_BOX_FIELDS, detections)),
+                dtype=np.int32, count=4 * n,
+            ).reshape(n, 4),
+            confidences=np.fromiter(
+                map(_CONFIDENCE, detections), dtype=np.float64, count=n
+            ),
+        )
+
+    @classmethod
+    def concat(cls, *batches: "DetectionBatch") -> "DetectionBatch":
+        """Birden fazla batch'i tek batch'te birleştirir (multi-pass için)."""
+        return cls(
+            boxes=np.concatenate([b.boxes for b in batches]),
+            confidences=np.concatenate([b.confidences for b in batches]),
+        )
+
+    def scale(self, factor: float) -> "DetectionBatch":
+        """
+        Tüm kutuların koordinatlarını tek vektörel işlemle ölçekler.
+
+        Ön-işlemede küçültülen kareden gelen koordinatları orijinal
+        boyuta geri dönüştürür (bkz. Detection.scale). Tespit başına
+        Python aritmetiği ve nesne üretimi yerine tek bir numpy çarpımı yapılır.
+
+        Args:
+            factor: Ölçekleme faktörü (0-1 arası küçültme).
+
+        Returns:
+            Ölçeklenmiş kutulara sahip yeni DetectionBatch
+            (güven skorları aynı dizi olarak paylaşılır).
+        """
+        return DetectionBatch(
+            boxes=self.scale_boxes(self.boxes, factor),
+            confidences=self.confidences,
+        )
+
+    @staticmethod
+    def scale_boxes(boxes: np.ndarray, factor: float) -> np.ndarray:
+        """
+        (N, 4) kutu dizisini 1/factor ile çarpar ve int32'ye keser.
+
+        Bölme yerine bir kez hesaplanan tersi ile çarpılır; astype(int32)
+        int() gibi sıfıra doğru keser.
+        """
+        inv = 1.0 / factor
+        return np.multiply(boxes, inv).astype(np.int32, copy=False)
+
+    def select(self, index) -> "DetectionBatch":
+        """
+        Boolean maske veya indeks dizisiyle alt küme seçer.
+
+        Args:
+            index: (N,) bool maske veya tamsayı indeks dizisi.
+
+        Returns:
+            Seçilen satırları içeren yeni DetectionBatch.
+        """
+        return DetectionBatch(
+            boxes=self.boxes[index],
+            confidences=self.confidences[index],
+        )
+
+    def __len__(self) -> int:
+        return len(self.confidences)
+
+    def __getitem__(self, i):
+        """
+        i. satırı Detection nesnesi olarak döndürür (tembel üretim).
+
+        .tolist() / .item() satırı doğrudan native int/float'a çevirir —
+        eleman başına numpy skaleri üretip int()/float() ile dönüştürmek gerekmez.
+
+        Dilim, bool maske veya indeks dizisi verilirse alt küme
+        select() ile yeni DetectionBatch olarak döner.
+        """
+        if not isinstance(i, (int, np.integer)):
+            return self.select(i)
+        x, y, w, h = self.boxes[i].tolist()
+        return Detection(x, y, w, h, self.confidences[i].item())
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Değer karşılaştırması — List[Detection] ile aynı anlam.
+
+        Başka bir DetectionBatch ile kutu ve güven dizileri, Detection
+        dizisi (liste/tuple) ile satırlar tek tek karşılaştırılır.
+        """
+        if isinstance(other, DetectionBatch):
+            return (
+                np.array_equal(self.boxes, other.boxes)
+                and np.array_equal(self.confidences, other.confidences)
+            )
+        if isinstance(other, (list, tuple)):
+            return self.to_list() == list(other)
+        return NotImplemented
+
+    # Listeler gibi değiştirilebilir dizileri taşır — hash'lenemez
+    __hash__ = None
+
+    def __iter__(self) -> Iterator[Detection]:
+        return iter(self.to_list())
+
+    def to_list(self) -> List[Detection]:
+        """
+        Tüm satırları Detection listesine dönüştürür.
+
+        .tolist() numpy skalerlerini C seviyesinde tek seferde native
+        int/float'a çevirir; satır satır indeksleme + int()/float()
+        dönüşümünden belirgin şekilde hızlıdır.
+        """
+        return [
+            Detection(x, y, w, h, conf)
+            for (x, y, w, h), conf in zip(
+                self.boxes.tolist(), self.confidences.tolist()
+            )
+        ]
+
+
 # =============================================================================
 # SOYUT DEDEKTÖR SINIFI
 # =============================================================================
@@ -102,14 +317,18 @@ class BaseDetector(ABC):
         - initialize(): Model/dedektör yükleme (bir kez çağrılır)
         - detect(): Kare üzerinde tespit yapma (her frame için çağrılır)
 
+    Opsiyonel olarak release() override edilebilir — dedektörün
+    tuttuğu ek kaynaklar (thread havuzu vb.) burada serbest bırakılır.
+
     Kullanım:
         detector = HOGDetector(config)  # Alt sınıf oluştur
         detector.initialize()            # Modeli yükle
         detections = detector.detect(frame)  # Tespit yap
+        detector.release()               # Kaynakları serbest bırak
     """
 
     @abstractmethod
-    def detect(self, frame: np.ndarray) -> List[Detection]:
+    def detect(self, frame: np.ndarray) -> DetectionBatch:
         """
         Frame üzerinde nesne tespiti yapar.
 
@@ -117,7 +336,10 @@ class BaseDetector(ABC):
             frame: Girdi frame (BGR veya gri tonlama numpy array).
 
         Returns:
-            Tespit edilen nesnelerin listesi (boş liste olabilir).
+            Tespit edilen nesneler (SoA batch, boş olabilir). Liste üreten
+            dedektörler sonucu DetectionBatch.from_detections() ile
+            dönüştürmelidir — ölçekleme ve post-processing batch dizileri
+            üzerinde çalışır.
         """
 
     @abstractmethod
@@ -127,3 +349,9 @@ class BaseDetector(ABC):
         Model yükleme, SVM ağırlıklarını atama vb. işlemler
         burada yapılır. Pipeline başlamadan önce bir kez çağrılır.
         """
+
+    def release(self) -> None:
+        """
+        Dedektörün tuttuğu kaynakları serbest bırakır.
+        Varsayılan olarak hiçbir şey yapmaz; pipeline sonunda çağrılır.
+        """
@@ -15,22 +15,73 @@ Multi-Pass Tespit:
     İsteğe bağlı olarak farklı parametrelerle ikinci bir tarama yapılır.
     Bu, kalabalık ortamda birinci geçişin kaçırdığı yayaları yakalamaya
     çalışır. Performans maliyeti yüksektir (varsayılan kapalı).
+    Birinci geçiş zaten multi_pass_skip_threshold kadar tespit bulduysa
+    ikinci geçiş atlanır.
+    İki geçişin ölçekleri multi_pass_merge_scale_delta'dan yakınsa geçişler
+    tek bir birleşik taramaya indirgenir (varsayılan kapalı).
+
+Toplu (Batch) Tespit:
+    detect_batch() birden fazla kareyi kalıcı bir thread havuzunda paralel
+    işler. detectMultiScale C++ tarafında GIL'i bıraktığı için thread'ler
+    gerçekten eş zamanlı çalışır.
+
+Descriptor Havuzu (Object Pool):
+    detectMultiScale'in aynı HOGDescriptor üzerinde eş zamanlı çağrılara
+    karşı güvenli (reentrant) olduğu garanti edilmez. Bu yüzden her worker
+    thread, modül seviyesindeki havuzdan kendine ait, SVM'i önceden atanmış
+    bir descriptor ödünç alır ve iş bitince geri bırakır. Descriptor oluşturma
+    ve setSVMDetector maliyeti yalnızca havuz büyürken ödenir.
+
+GPU (CUDA) Arka Ucu:
+    DetectionConfig.use_cuda=True ve CUDA destekli bir GPU varsa
+    initialize() cv2.cuda.HOG kullanır. Kare her geçiş için değil, kare
+    başına bir kez GPU'ya yüklenir; her geçiş kendi parametreleri
+    atanmış ayrı bir CUDA descriptor'ı ile çalışır. GPU bulunamazsa
+    CPU descriptor havuzuna dönülür.
+
+Şerit (Stripe) Paralelliği:
+    DetectionConfig.stripe_min_height > 0 ise yüksek kareler örtüşen yatay
+    şeritlere bölünür ve şeritler thread havuzunda eş zamanlı taranır
+    (varsayılan kapalı).
 
 Sınıf Hiyerarşisi:
     BaseDetector (abstract) → HOGDetector (concrete)
 """
 
-from typing import List
+import os
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
 
-import cv2
 import numpy as np
 
 from config.settings import DetectionConfig
-from core.detection.base_detector import BaseDetector, Detection
+from core.detection.base_detector import BaseDetector, DetectionBatch
 from utils.logger import get_logger
+from utils.opencv_runtime import configure_opencv, set_opencv_threads
+
+if TYPE_CHECKING:
+    # Yalnızca tip denetimi için — çalışma zamanında cv2 initialize()
+    # içinde yüklenir (bkz. HOGDetector.initialize)
+    import cv2
 
 logger = get_logger(__name__)
 
+# =============================================================================
+# HOG DESCRIPTOR HAVUZU
+# =============================================================================
+# Anahtar: (pencere boyutu, SVM ağırlık sürümü) — aynı anahtara sahip
+# descriptor'lar birbirinin yerine kullanılabilir.
+_DEFAULT_POOL_KEY = ((64, 128), "default_people")
+
+# Anahtar başına en fazla tutulacak boşta descriptor sayısı
+# (her worker thread + dedektörün kendi descriptor'ı)
+_POOL_MAXSIZE = (os.cpu_count() or 1) + 1
+
+# LIFO: En son bırakılan (cache'te sıcak) descriptor önce verilir
+_HOG_POOL: Dict[tuple, "queue.LifoQueue[cv2.HOGDescriptor]"] = {}
+
 
 class HOGDetector(BaseDetector):
     """
@@ -41,6 +92,11 @@ class HOGDetector(BaseDetector):
     SVM ağırlıklarını içerir.
     """
 
+    # DefaultPeopleDetector SVM ağırlıkları (~3800 float) — sınıf seviyesinde
+    # önbellek. İlk initialize() çağrısında OpenCV'den bir kez kopyalanır,
+    # sonraki dedektörler (çoklu pipeline, testler) aynı diziyi kullanır.
+    _SVM: Optional[np.ndarray] = None
+
     def __init__(self, config: DetectionConfig) -> None:
         """
         Args:
@@ -48,7 +104,84 @@ class HOGDetector(BaseDetector):
         """
         self._config = config
         # HOG descriptor — initialize() çağrılana kadar None
-        self._hog: cv2.HOGDescriptor = None
+        self._hog: "cv2.HOGDescriptor" = None
+        # detect_batch() için kalıcı thread havuzu — initialize() ile oluşturulur
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        # --- Sık okunan parametrelerin önbelleği ---
+        # detect() her karede çağrılır; config (frozen) değişmeyeceği için
+        # değerler burada bir kez düz instance attribute'larına alınır.
+        # Böylece her karede iç içe dataclass attribute okuması yapılmaz.
+        self._min_w, self._min_h = config.min_detection_size
+        self._multi_pass = config.enable_multi_pass
+        self._multi_pass_skip = config.multi_pass_skip_threshold
+
+        # detectMultiScale keyword argümanları — her geçiş hep aynı
+        # parametrelerle çağrılır; initialize() bunları partial ile bağlar.
+        # Geçiş 1: Standart parametreler (hitThreshold=0.0 → tüm sonuçları al,
+        #   eleme post-processing'deki güven eşiği ile yapılır)
+        self._pass1_kwargs = {
+            "winStride": config.win_stride,
+            "padding": config.padding,
+            "scale": config.scale,
+            "hitThreshold": 0.0,
+        }
+        # Geçiş 2: Yoğun tarama parametreleri (multi-pass)
+        self._pass2_kwargs = {
+            "winStride": config.second_pass_win_stride,
+            "padding": config.second_pass_padding,
+            "scale": config.second_pass_scale,
+            "hitThreshold": config.second_pass_hit_threshold,
+        }
+
+        # Ölçekler yeterince yakınsa iki geçiş tek birleşik geçişe indirgenir
+        if self._multi_pass and (
+            abs(config.scale - config.second_pass_scale)
+            < config.multi_pass_merge_scale_delta
+        ):
+            self._pass1_kwargs = self._merge_pass_kwargs(
+                self._pass1_kwargs, self._pass2_kwargs
+            )
+            self._multi_pass = False
+
+        # Parametreleri önceden bağlanmış geçiş fonksiyonları — initialize() ile atanır
+        self._pass1: Optional[Callable] = None
+        self._pass2: Optional[Callable] = None
+
+        # Eş zamanlı multi-pass: ikinci geçiş kendi descriptor'ı (_hog2) ile
+        # thread havuzunda, birinci geçiş çağıran thread'de çalışır
+        self._parallel_passes = self._multi_pass and config.parallel_multi_pass
+        self._hog2: "cv2.HOGDescriptor" = None
+
+        # Şerit paralelliği — yüksek kareler yatay şeritlerde eş zamanlı taranır.
+        # Eş zamanlı multi-pass ile birlikte kapalıdır: ikinci geçiş zaten bir
+        # worker'da çalışır; şeritleri aynı havuzda beklemesi kilitlenebilir.
+        self._stripe_min_height = config.stripe_min_height
+        self._striped = self._stripe_min_height > 0 and not self._parallel_passes
+        # Örtüşme: post-processing'den geçebilecek en yüksek kutu
+        self._stripe_overlap = config.max_detection_size[1]
+        self._stripe_count = os.cpu_count() or 1
+
+        # CUDA arka ucu — initialize() GPU bulursa True olur
+        self._cuda = False
+        # Karenin yükleneceği kalıcı GPU tamponu (CUDA arka ucunda)
+        self._gpu_frame = None
+
+    @staticmethod
+    def _merge_pass_kwargs(first: dict, second: dict) -> dict:
+        """
+        İki geçişin parametrelerini tek bir birleşik taramaya indirger.
+
+        Her parametrenin "daha kapsayıcı" değeri seçilir: daha küçük adım ve
+        ölçek (daha yoğun tarama), daha geniş dolgu ve daha düşük eşik —
+        böylece iki geçişin adayları tek taramada birlikte üretilir.
+        """
+        return {
+            "winStride": tuple(map(min, first["winStride"], second["winStride"])),
+            "padding": tuple(map(max, first["padding"], second["padding"])),
+            "scale": min(first["scale"], second["scale"]),
+            "hitThreshold": min(first["hitThreshold"], second["hitThreshold"]),
+        }
 
     def initialize(self) -> None:
         """
@@ -57,22 +190,137 @@ class HOGDetector(BaseDetector):
         Bu metot pipeline başlamadan önce bir kez çağrılmalıdır.
         DefaultPeopleDetector, OpenCV'deki hazır yaya tanıma
         ağırlıklarını kullanır (INRIA dataset'i üzerinde eğitilmiş).
-        """
-        # HOGDescriptor oluştur — varsayılan pencere boyutu 64x128 piksel
-        self._hog = cv2.HOGDescriptor()
 
-        # INRIA Pedestrian Dataset üzerinde eğitilmiş SVM ağırlıklarını ata
-        self._hog.setSVMDetector(cv2.HOGDescriptor_getDefaultPeopleDetector())
+        NOT: cv2 descriptor oluşturulurken (tembel) import edilir. cv2 büyük
+        bir native modüldür; modül seviyesinde import edilseydi yalnızca
+        detection paketini import eden araçlar (rapor, config okuma vb.)
+        da bu yükleme maliyetini öderdi.
+        """
+        # OpenCV SIMD/HAL yolları ve thread sayısı (süreç başına bir kez)
+        configure_opencv()
+
+        # İstenirse OpenCV thread havuzu küçültülür (varsayılan: tüm çekirdekler)
+        if self._config.opencv_threads > 0:
+            set_opencv_threads(self._config.opencv_threads)
+
+        # GPU istendiyse ve kullanılabilirse CUDA arka ucu kurulur
+        if self._config.use_cuda and self._hog is None:
+            self._cuda = self._initialize_cuda()
+
+        if not self._cuda:
+            # Havuzdan SVM'i atanmış bir descriptor al (yoksa oluşturulur)
+            if self._hog is None:
+                self._hog = self._acquire_descriptor()
+
+            # Geçişler bir kez bağlanır: bound method + sabit keyword argümanlar.
+            # detect() her karede yalnızca self._pass1(frame) çağırır — bound
+            # method üretimi ve keyword dict'i her karede tekrarlanmaz.
+            self._pass1, self._pass2 = self._bind_passes(self._hog)
+
+            # Eş zamanlı geçişlerde ikinci geçiş ayrı bir descriptor'a
+            # bağlanır — iki thread aynı HOGDescriptor durumunu paylaşmaz
+            if self._parallel_passes:
+                if self._hog2 is None:
+                    self._hog2 = self._acquire_descriptor()
+                self._pass2 = partial(
+                    self._hog2.detectMultiScale, **self._pass2_kwargs
+                )
+
+            # Şerit paralelliğinde geçişler şeritleri havuza dağıtan
+            # sarmalayıcıya bağlanır (kısa karelerde doğrudan taranır)
+            if self._striped:
+                self._pass1 = partial(
+                    self._striped_detect, self._hog.detectMultiScale,
+                    self._pass1_kwargs,
+                )
+                if self._pass2 is not None:
+                    self._pass2 = partial(
+                        self._striped_detect, self._hog.detectMultiScale,
+                        self._pass2_kwargs,
+                    )
+
+        # Thread havuzu bir kez oluşturulur ve tüm detect_batch() çağrılarında
+        # yeniden kullanılır (thread'ler ilk iş gönderildiğinde başlatılır)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                thread_name_prefix="hog",
+            )
 
         logger.info(
             "HOG Dedektör başlatıldı | winStride: %s | scale: %.2f | "
-            "multi-pass: %s",
+            "multi-pass: %s | backend: %s",
             self._config.win_stride,
             self._config.scale,
             self._config.enable_multi_pass,
+            "cuda" if self._cuda else "cpu",
         )
 
-    def detect(self, frame: np.ndarray) -> List[Detection]:
+    def _initialize_cuda(self) -> bool:
+        """
+        CUDA HOG descriptor'larını oluşturur ve geçişleri bunlara bağlar.
+
+        cv2.cuda.HOG parametreleri (winStride, scale, hitThreshold) çağrı
+        argümanı değil descriptor özelliğidir; bu yüzden her geçiş için
+        ayrı bir descriptor yapılandırılır. Gruplama kapatılır
+        (groupThreshold=0): CUDA HOG güven skorlarını yalnızca gruplama
+        yokken döndürür; çakışan kutular post-processing'deki NMS ile elenir.
+
+        Returns:
+            CUDA arka ucu kurulduysa True, GPU yoksa False (CPU'ya dönülür).
+        """
+        import cv2
+
+        if not hasattr(cv2, "cuda") or cv2.cuda.getCudaEnabledDeviceCount() == 0:
+            logger.warning(
+                "use_cuda=True fakat CUDA destekli GPU bulunamadı — "
+                "CPU dedektörü kullanılıyor."
+            )
+            return False
+
+        gpu_hog1 = self._create_cuda_descriptor(self._pass1_kwargs)
+        self._hog = gpu_hog1
+        self._pass1 = partial(self._cuda_pass, gpu_hog1)
+        if self._multi_pass:
+            gpu_hog2 = self._create_cuda_descriptor(self._pass2_kwargs)
+            self._pass2 = partial(self._cuda_pass, gpu_hog2)
+
+        self._gpu_frame = cv2.cuda_GpuMat()
+        return True
+
+    @classmethod
+    def _create_cuda_descriptor(cls, pass_kwargs: dict):
+        """Verilen geçiş parametreleriyle yapılandırılmış bir cv2.cuda.HOG oluşturur."""
+        import cv2
+
+        gpu_hog = cv2.cuda.HOG_create()  # Varsayılan pencere: 64x128
+        gpu_hog.setSVMDetector(gpu_hog.getDefaultPeopleDetector())
+        gpu_hog.setWinStride(pass_kwargs["winStride"])
+        gpu_hog.setScaleFactor(pass_kwargs["scale"])
+        gpu_hog.setHitThreshold(pass_kwargs["hitThreshold"])
+        gpu_hog.setGroupThreshold(0)
+        return gpu_hog
+
+    @staticmethod
+    def _cuda_pass(gpu_hog, gpu_frame) -> tuple:
+        """CUDA descriptor ile tek geçiş çalıştırır → (regions, weights)."""
+        return gpu_hog.detectMultiScale(gpu_frame)
+
+    def _upload(self, frame: np.ndarray):
+        """
+        Kareyi kalıcı GPU tamponuna yükler.
+
+        CUDA HOG yalnızca gri (CV_8UC1) veya BGRA (CV_8UC4) girdi kabul
+        eder; BGR kareler GPU üzerinde BGRA'ya çevrilir.
+        """
+        import cv2
+
+        self._gpu_frame.upload(frame)
+        if frame.ndim == 3:
+            return cv2.cuda.cvtColor(self._gpu_frame, cv2.COLOR_BGR2BGRA)
+        return self._gpu_frame
+
+    def detect(self, frame: np.ndarray) -> DetectionBatch:
         """
         HOG + SVM ile yaya tespiti yapar.
 
@@ -86,7 +334,7 @@ class HOGDetector(BaseDetector):
             frame: BGR veya gri tonlama girdi frame (ön-işlenmiş).
 
         Returns:
-            Tespit edilen yayaların listesi (filtrelenmemiş ham sonuçlar).
+            Tespit edilen yayalar (filtrelenmemiş ham sonuçlar, SoA batch).
 
         Raises:
             RuntimeError: Dedektör henüz başlatılmadıysa.
@@ -95,40 +343,258 @@ class HOGDetector(BaseDetector):
         if self._hog is None:
             raise RuntimeError("Dedektör başlatılmadı. Önce initialize() çağırın.")
 
-        # --- Geçiş 1: Standart parametreler ---
-        # Ana tarama — hızlı ve genel amaçlı
-        detections = self._single_pass(
+        return self._run_passes(
             frame,
-            win_stride=self._config.win_stride,
-            padding=self._config.padding,
-            scale=self._config.scale,
+            self._pass1,
+            self._pass2,
+            self._executor if self._parallel_passes and not self._cuda else None,
         )
 
+    def _bind_passes(self, hog: "cv2.HOGDescriptor") -> tuple:
+        """
+        Verilen descriptor için parametreleri bağlanmış geçiş fonksiyonları üretir.
+
+        Returns:
+            (pass1, pass2) — pass2, multi-pass kapalıysa None.
+        """
+        pass1 = partial(hog.detectMultiScale, **self._pass1_kwargs)
+        pass2 = None
+        if self._multi_pass:
+            pass2 = partial(hog.detectMultiScale, **self._pass2_kwargs)
+        return pass1, pass2
+
+    def _run_passes(
+        self,
+        frame: np.ndarray,
+        pass1: Callable,
+        pass2: Optional[Callable],
+        executor: Optional[ThreadPoolExecutor] = None,
+    ) -> DetectionBatch:
+        """
+        Geçiş 1 ve (etkinse) geçiş 2'yi verilen geçiş fonksiyonlarıyla çalıştırır.
+
+        Args:
+            frame: Ön-işlenmiş girdi frame.
+            pass1: Parametreleri bağlanmış birinci geçiş.
+            pass2: Parametreleri bağlanmış ikinci geçiş (None → tek geçiş).
+                Geçişler dedektörün kendi descriptor'ına veya havuzdan ödünç
+                alınan bir descriptor'a bağlı olabilir.
+            executor: Verilirse ikinci geçiş bu havuzda birinci geçişle eş
+                zamanlı çalışır (pass2 ayrı bir descriptor'a bağlı olmalıdır).
+                Worker thread'lerden çağrılırken None verilir — havuz
+                kendi işini beklerse kilitlenebilir.
+
+        Returns:
+            İki geçişin birleşik ham sonuçları.
+        """
+        # --- Girdi tipini sabitle (uint8) ---
+        # detectMultiScale uint8 dışındaki girdiyi her çağrıda kendi içinde
+        # dönüştürür. Dönüşüm burada bir kez yapılır; iki geçiş de aynı uint8
+        # kareyi kullanır (piksel başına 4 yerine 1 bayt bellek trafiği).
+        # Preprocessor zaten uint8 ürettiği için normal akışta bu dal çalışmaz.
+        if frame.dtype != np.uint8:
+            frame = np.clip(frame, 0, 255).astype(np.uint8, copy=False)
+
+        # --- Bellek düzenini sabitle (C-contiguous) ---
+        # Ters çevrilmiş kanal (frame[:, :, ::-1]) veya sütun kırpılmış ROI
+        # gibi görünümleri OpenCV her detectMultiScale çağrısında gizlice
+        # kopyalar. Kopya burada bir kez yapılır; tüm geçişler paylaşır.
+        if not frame.flags.c_contiguous:
+            frame = np.ascontiguousarray(frame)
+
+        # CUDA arka ucunda kare bir kez GPU'ya yüklenir; iki geçiş de
+        # aynı GPU tamponunu kullanır
+        if self._cuda:
+            frame = self._upload(frame)
+
+        # --- Eş zamanlı multi-pass ---
+        # İkinci geçiş havuza gönderilir, birinci geçiş bu thread'de çalışır.
+        # detectMultiScale GIL'i bıraktığı için iki tarama gerçekten örtüşür.
+        if pass2 is not None and executor is not None:
+            future = executor.submit(self._single_pass, frame, pass2)
+            detections = self._single_pass(frame, pass1)
+            return DetectionBatch.concat(detections, future.result())
+
+        # --- Geçiş 1: Standart parametreler ---
+        # Ana tarama — hızlı ve genel amaçlı
+        detections = self._single_pass(frame, pass1)
+
         # --- Geçiş 2: Yoğun tarama (kalabalık ortam için) ---
         # Daha küçük adım ve daha ince piramit ile ek tarama
-        # Bu geçiş YALNIZCA enable_multi_pass=True olduğunda çalışır
-        if self._config.enable_multi_pass:
-            second_pass = self._single_pass(
-                frame,
-                win_stride=self._config.second_pass_win_stride,
-                padding=self._config.second_pass_padding,
-                scale=self._config.second_pass_scale,
-                hit_threshold=self._config.second_pass_hit_threshold,
-            )
+        # Bu geçiş YALNIZCA enable_multi_pass=True olduğunda çalışır.
+        # Birinci geçiş yeterince tespit bulduysa (multi_pass_skip_threshold)
+        # ikinci tarama ek kazanç getirmez ve atlanır.
+        if pass2 is not None and (
+            self._multi_pass_skip <= 0 or len(detections) < self._multi_pass_skip
+        ):
+            second_pass = self._single_pass(frame, pass2)
             # İki geçişin sonuçları birleştirilir
             # Çift tespitler post-processing'de NMS ile elenir
-            detections.extend(second_pass)
+            detections = DetectionBatch.concat(detections, second_pass)
 
         return detections
 
+    def _striped_detect(
+        self, detect_multiscale: Callable, pass_kwargs: dict, frame: np.ndarray
+    ) -> tuple:
+        """
+        Kareyi örtüşen yatay şeritlere bölüp şeritleri paralel tarar.
+
+        OpenCV detectMultiScale'i kendi içinde genişliğe göre parçalar;
+        bu sarmalayıcı ise yüksekliğe göre böler ve her şeridi thread
+        havuzunda havuzdan ödünç alınan ayrı bir descriptor ile tarar.
+        Şerit kesitleri (frame[y0:y1]) kopya değil görünümdür.
+
+        Args:
+            detect_multiscale: Kısa karelerde kullanılacak dedektör metodu.
+            pass_kwargs: Geçişin detectMultiScale keyword argümanları.
+            frame: Girdi frame.
+
+        Returns:
+            detectMultiScale ile aynı biçimde (regions, weights) —
+            koordinatlar tam kareye göredir.
+        """
+        height = frame.shape[0]
+        overlap = self._stripe_overlap
+
+        # Kısa kare → şeritlemenin ek taraması kazançtan fazladır
+        if height < self._stripe_min_height or height <= 2 * overlap:
+            return detect_multiscale(frame, **pass_kwargs)
+
+        # Şerit adımı: her worker'a bir şerit; şerit yüksekliği adım + örtüşme
+        step = max(-(-(height - overlap) // self._stripe_count), overlap)
+        span = step + overlap
+        results = list(self._executor.map(
+            partial(self._detect_stripe, frame, span, pass_kwargs),
+            range(0, height - overlap, step),
+        ))
+
+        found = [(r, w) for r, w in results if len(r)]
+        if not found:
+            return (), ()
+        return (
+            np.concatenate([r for r, _ in found]),
+            np.concatenate([np.asarray(w, dtype=np.float64).ravel() for _, w in found]),
+        )
+
+    def _detect_stripe(
+        self, frame: np.ndarray, span: int, pass_kwargs: dict, y0: int
+    ) -> tuple:
+        """Tek bir şeridi havuzdan ödünç alınan descriptor ile tarar."""
+        hog = self._acquire_descriptor()
+        try:
+            regions, weights = hog.detectMultiScale(
+                frame[y0:y0 + span], **pass_kwargs
+            )
+        finally:
+            self._release_descriptor(hog)
+
+        if len(regions) == 0:
+            return regions, weights
+        # Şerit koordinatlarını tam kare koordinatlarına taşı
+        regions = np.array(regions, dtype=np.int32)
+        regions[:, 1] += y0
+        return regions, weights
+
+    def detect_batch(self, frames: List[np.ndarray]) -> List[DetectionBatch]:
+        """
+        Birden fazla kare üzerinde paralel tespit yapar.
+
+        Her kare thread havuzuna ayrı bir iş olarak gönderilir; her iş
+        descriptor havuzundan kendi HOGDescriptor'ını ödünç alır.
+        detectMultiScale GIL'i bıraktığından çekirdek sayısına kadar
+        yaklaşık doğrusal hızlanma elde edilir.
+
+        Args:
+            frames: Ön-işlenmiş karelerin listesi.
+
+        Returns:
+            Her kare için bir DetectionBatch (girdi sırasıyla aynı sırada).
+
+        Raises:
+            RuntimeError: Dedektör henüz başlatılmadıysa.
+        """
+        if self._hog is None:
+            raise RuntimeError("Dedektör başlatılmadı. Önce initialize() çağırın.")
+
+        # CUDA arka ucunda tek GPU ve tek yükleme tamponu paylaşılır —
+        # kareler sırayla işlenir (paralellik GPU'nun kendi içindedir)
+        if self._cuda:
+            return [self.detect(frame) for frame in frames]
+
+        return list(self._executor.map(self._detect_pooled, frames))
+
+    def _detect_pooled(self, frame: np.ndarray) -> DetectionBatch:
+        """
+        Havuzdan ödünç alınan descriptor ile tespit yapar (worker thread'ler için).
+
+        Her worker kendi descriptor'ını kullanır — dedektörün kendi
+        descriptor'ı thread'ler arasında paylaşılmaz.
+        """
+        hog = self._acquire_descriptor()
+        try:
+            return self._run_passes(frame, *self._bind_passes(hog))
+        finally:
+            self._release_descriptor(hog)
+
+    def release(self) -> None:
+        """Thread havuzunu kapatır ve descriptor'ı havuza geri bırakır."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+        if self._hog2 is not None:
+            self._release_descriptor(self._hog2)
+            self._hog2 = None
+
+        if self._hog is not None:
+            # CUDA descriptor'ları CPU havuzuna ait değildir
+            if not self._cuda:
+                self._release_descriptor(self._hog)
+            self._hog = None
+            self._pass1 = self._pass2 = None
+            self._cuda = False
+            self._gpu_frame = None
+
+    @classmethod
+    def _acquire_descriptor(cls) -> "cv2.HOGDescriptor":
+        """
+        Havuzdan SVM ağırlıkları atanmış bir descriptor alır.
+        Havuz boşsa yeni bir descriptor oluşturulur ve yapılandırılır.
+        """
+        pool = _HOG_POOL.setdefault(
+            _DEFAULT_POOL_KEY, queue.LifoQueue(maxsize=_POOL_MAXSIZE)
+        )
+        try:
+            return pool.get_nowait()
+        except queue.Empty:
+            return cls._create_descriptor()
+
+    @staticmethod
+    def _release_descriptor(hog: "cv2.HOGDescriptor") -> None:
+        """Descriptor'ı havuza geri bırakır (havuz doluysa atılır)."""
+        try:
+            _HOG_POOL[_DEFAULT_POOL_KEY].put_nowait(hog)
+        except queue.Full:
+            pass
+
+    @classmethod
+    def _create_descriptor(cls) -> "cv2.HOGDescriptor":
+        """Yeni bir HOGDescriptor oluşturur ve varsayılan SVM'i atar."""
+        import cv2
+
+        # HOGDescriptor oluştur — varsayılan pencere boyutu 64x128 piksel
+        hog = cv2.HOGDescriptor()
+
+        # INRIA Pedestrian Dataset üzerinde eğitilmiş SVM ağırlıklarını ata
+        if cls._SVM is None:
+            cls._SVM = cv2.HOGDescriptor_getDefaultPeopleDetector()
+        hog.setSVMDetector(cls._SVM)
+        return hog
+
     def _single_pass(
-        self,
-        frame: np.ndarray,
-        win_stride: tuple,
-        padding: tuple,
-        scale: float,
-        hit_threshold: float = 0.0,
-    ) -> List[Detection]:
+        self, frame: np.ndarray, run_pass: Callable
+    ) -> DetectionBatch:
         """
         Tek geçişlik HOG tespiti yapar.
 
@@ -139,42 +605,34 @@ class HOGDetector(BaseDetector):
 
         Args:
             frame: Girdi frame.
-            win_stride: Kayan pencere adımı (piksel).
-            padding: Kenar dolgusu (piksel).
-            scale: Piramit ölçek faktörü.
-            hit_threshold: SVM karar eşiği (0.0 → tüm sonuçları al).
+            run_pass: Parametreleri (winStride, padding, scale, hitThreshold)
+                önceden bağlanmış detectMultiScale çağrısı (bkz. _bind_passes).
 
         Returns:
-            Minimum boyut filtresini geçen tespitlerin listesi.
+            Minimum boyut filtresini geçen tespitler (SoA batch).
         """
         # detectMultiScale → (regions, weights)
         # regions: Tespit edilen kutuların [x, y, w, h] dizisi
         # weights: Her kutu için SVM güven skorları
-        regions, weights = self._hog.detectMultiScale(
-            frame,
-            winStride=win_stride,
-            padding=padding,
-            scale=scale,
-            hitThreshold=hit_threshold,
-        )
-
-        detections: List[Detection] = []
-
-        # Her tespit bölgesi için Detection nesnesi oluştur
-        for (x, y, w, h), weight in zip(regions, weights):
-            confidence = float(weight)  # numpy → Python float dönüşümü
-
-            # --- Minimum boyut filtresi ---
-            # Çok küçük tespitler genellikle gürültüdür (uzaktaki objeler,
-            # sensör artefaktları vb.). Minimum boyutu geçemeyenler elenir.
-            if w < self._config.min_detection_size[0]:
-                continue  # Genişlik çok küçük
-            if h < self._config.min_detection_size[1]:
-                continue  # Yükseklik çok küçük
-
-            detections.append(Detection(
-                x=int(x), y=int(y), w=int(w), h=int(h),
-                confidence=confidence,
-            ))
-
-        return detections
+        regions, weights = run_pass(frame)
+
+        # Tespit yoksa OpenCV boş tuple döndürür
+        if len(regions) == 0:
+            return DetectionBatch.empty()
+
+        # Sınırda tek seferlik normalizasyon: sabit dtype + C-contiguous düzen.
+        # Sonraki maskeleme, NMS çekirdeği (numba) ve .tolist() dönüşümleri
+        # ek kopya veya dtype dönüşümü yapmadan bu dizileri kullanır.
+        regions = np.ascontiguousarray(regions, dtype=np.int32)
+        # weights OpenCV sürümüne göre (N,) veya (N, 1) float64 olarak gelir;
+        # float64 korunur — rapordaki güven skorları OpenCV'nin double
+        # değerleriyle birebir aynı kalır (float32 yuvarlama artefaktı olmaz)
+        weights = np.ascontiguousarray(weights, dtype=np.float64).ravel()
+
+        # --- Minimum boyut filtresi (vektörel) ---
+        # Çok küçük tespitler genellikle gürültüdür (uzaktaki objeler,
+        # sensör artefaktları vb.). Tek bir numpy maskesi ile tüm kutular
+        # aynı anda kontrol edilir — kutu başına Python döngüsü yoktur.
+        mask = (regions[:, 2] >= self._min_w) & (regions[:, 3] >= self._min_h)
+
+        return DetectionBatch(boxes=regions[mask], confidences=weights[mask])
@@ -16,18 +16,25 @@ Neden Post-Processing Gerekli?
     - Post-processing bu problemleri temizler
 """
 
-from typing import List
+from typing import Sequence
 
 import cv2
 import numpy as np
 
 from config.settings import DetectionConfig
-from core.detection.base_detector import Detection
+from core.detection.base_detector import Detection, DetectionBatch
+from core.detection.nms import (
+    NUMBA_AVAILABLE, fast_nms, nms_kernel, warm_up_nms_kernel,
+)
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+# Desteklenen NMS yöntemleri (DetectionConfig.nms_method)
+NMS_METHODS = ("greedy", "fast")
+
+
 class Postprocessor:
     """
     Tespit sonuçlarını filtreler ve düzenler.
@@ -40,15 +47,37 @@ class Postprocessor:
         """
         Args:
             config: Tespit konfigürasyonu (eşik değerleri ve boyut sınırları).
+
+        Raises:
+            ValueError: nms_method desteklenmiyorsa.
         """
+        if config.nms_method not in NMS_METHODS:
+            raise ValueError(
+                f"Geçersiz NMS yöntemi: {config.nms_method!r} "
+                f"(desteklenen: {', '.join(NMS_METHODS)})"
+            )
         self._config = config
+        self._fast_nms = config.nms_method == "fast"
+
+        # Boyut/oran filtresi sınırları her karede okunur — tuple açma ve
+        # attribute okumasını her karede tekrarlamamak için skaler olarak saklanır
+        self._max_w, self._max_h = config.max_detection_size
+        self._min_ratio = config.min_aspect_ratio
+        self._max_ratio = config.max_aspect_ratio
+
+        # Greedy NMS JIT çekirdeği kullanılacaksa derleme/önbellek yükleme
+        # burada yapılır — ilk karenin gecikmesi önlenir
+        if NUMBA_AVAILABLE and not self._fast_nms:
+            warm_up_nms_kernel()
+
         logger.info(
-            "Postprocessor başlatıldı | NMS eşiği: %.2f | Güven eşiği: %.2f",
+            "Postprocessor başlatıldı | NMS: %s (%.2f) | Güven eşiği: %.2f",
+            config.nms_method,
             config.nms_threshold,
             config.confidence_threshold,
         )
 
-    def process(self, detections: List[Detection]) -> List[Detection]:
+    def process(self, detections: Sequence[Detection]) -> DetectionBatch:
         """
         Tespit sonuçlarına filtreleme ve NMS uygular.
 
@@ -57,77 +86,82 @@ class Postprocessor:
             2. Boyut/oran → Yaya olmayan şekilleri ele
             3. NMS → En pahalı işlem (IoU hesaplaması), son adımda yapılır
 
+        Filtreler DetectionBatch dizileri üzerinde numpy maskeleri ile
+        vektörel uygulanır — tespit başına Python döngüsü yoktur.
+
         Args:
-            detections: HOG dedektöründen gelen ham tespit listesi.
+            detections: Dedektörden gelen ham tespitler (DetectionBatch
+                veya Detection listesi — liste ise batch'e dönüştürülür).
 
         Returns:
-            Filtrelenmiş ve NMS uygulanmış nihai tespit listesi.
+            Filtrelenmiş ve NMS uygulanmış nihai tespitler (SoA batch).
         """
-        # Boş liste kontrolü — gereksiz işlem yapma
-        if not detections:
-            return []
+        batch = DetectionBatch.from_detections(detections)
 
-        # --- Adım 1: Güven Eşiği Filtreleme ---
-        # confidence_threshold altındaki tespitler elenir.
-        # Bu en hızlı filtredir, çoğu sahte tespiti burada yakalar.
-        filtered = [
-            d for d in detections
-            if d.confidence >= self._config.confidence_threshold
-        ]
-
-        # --- Adım 2: Boyut ve En-Boy Oranı Filtresi ---
-        # Yaya olmayan şekilleri eler:
-        #   - Çok büyük kutular (birden fazla kişiyi kaplayan)
-        #   - Yatay kutular (araç, tabela gibi)
-        filtered = [
-            d for d in filtered
-            if self._is_valid_detection(d)
-        ]
-
-        if not filtered:
-            return []
+        # Boş batch kontrolü — gereksiz işlem yapma
+        if len(batch) == 0:
+            return batch
+
+        # --- Adım 1 + 2: Güven Eşiği ve Boyut/Oran Filtresi (tek maske) ---
+        # confidence_threshold altındaki tespitler ve yaya olmayan şekiller
+        # (çok büyük / yatay kutular) tek bir birleşik maske ile elenir.
+        # Tek select() → boxes/confidences dizileri bir kez kopyalanır.
+        batch = batch.select(self._valid_detection_mask(batch))
+
+        # Tek (veya hiç) tespit kaldıysa çakışma olamaz — NMS atlanır.
+        # Seyrek sahnelerde (0-1 yaya) karelerin çoğu bu yoldan döner.
+        if len(batch) <= 1:
+            return batch
 
         # --- Adım 3: Non-Maximum Suppression (NMS) ---
         # Çakışan kutuları birleştirir — en güvenlisini tutar
-        return self._apply_nms(filtered)
+        return self._apply_nms(batch)
 
-    def _is_valid_detection(self, det: Detection) -> bool:
+    def _valid_detection_mask(self, batch: DetectionBatch) -> np.ndarray:
         """
-        Tespitteki bounding box'ın yaya boyutuna ve oranına
-        uygun olup olmadığını kontrol eder.
+        Her tespitin güven eşiğini geçip geçmediğini ve bounding box'ın
+        yaya boyutuna ve oranına uygun olup olmadığını tek seferde
+        (vektörel) kontrol eder.
 
-        İki kriter uygulanır:
-            1. Maksimum boyut → Dev kutular tek yaya olamaz
-            2. En-boy oranı → Yayalar dikey yapıdadır (h/w > 1.3)
+        Üç kriter uygulanır:
+            1. Güven eşiği → En ucuz karşılaştırma, önce uygulanır
+            2. Maksimum boyut → Dev kutular tek yaya olamaz
+            3. En-boy oranı → Yayalar dikey yapıdadır (h/w > 1.3)
 
         Args:
-            det: Kontrol edilecek tespit.
+            batch: Ham tespitler (boxes: (N, 4) [x, y, w, h]).
 
         Returns:
-            True ise tespit geçerli (yaya olabilir), False ise elenir.
+            (N,) bool maske — True ise tespit geçerli (yaya olabilir).
         """
+        boxes = batch.boxes
+        w = boxes[:, 2]
+        h = boxes[:, 3]
+
+        # --- Güven eşiği ---
+        # Bu en hızlı filtredir, çoğu sahte tespiti burada yakalar.
+        mask = batch.confidences >= self._config.confidence_threshold
+
         # --- Maksimum boyut kontrolü ---
         # Çok büyük kutular genellikle birden fazla kişiyi veya
         # arka plan yapılarını (bina, vitrin) kapsar → sahte tespit
-        max_w, max_h = self._config.max_detection_size
-        if det.w > max_w or det.h > max_h:
-            return False
+        mask &= (w <= self._max_w) & (h <= self._max_h) & (w > 0)  # w > 0: sıfıra bölme koruması
 
         # --- En-boy oranı kontrolü ---
         # İnsan vücudu dikey yapıdadır: tipik oran h/w ≈ 2.0-2.5
         # min_aspect_ratio=1.3 → kısmen eğilmiş/oturan kişiler dahil
         # max_aspect_ratio=3.5 → aşırı ince/uzun nesneler (direkler) hariç
-        if det.w == 0:
-            return False  # Sıfıra bölme koruması
-        ratio = det.h / det.w
-        return self._config.min_aspect_ratio <= ratio <= self._config.max_aspect_ratio
+        ratio = np.divide(h, w, out=np.zeros(len(w), dtype=np.float64), where=w > 0)
+        mask &= ratio >= self._min_ratio
+        mask &= ratio <= self._max_ratio
+        return mask
 
     def _is_valid_aspect_ratio(self, det: Detection) -> bool:
         """
         Tespitteki bounding box'ın yaya oranına uygun olup olmadığını kontrol eder.
         Yayalar genellikle dikey yapıdadır (yükseklik/genişlik > 1.2).
 
-        NOT: Bu metot _is_valid_detection içine entegre edilmiştir.
+        NOT: Bu kontrol _valid_detection_mask içinde vektörel yapılır.
         Geriye dönük uyumluluk için korunmuştur.
         """
         if det.w == 0:
@@ -135,7 +169,7 @@ class Postprocessor:
         ratio = det.h / det.w
         return self._config.min_aspect_ratio <= ratio <= self._config.max_aspect_ratio
 
-    def _apply_nms(self, detections: List[Detection]) -> List[Detection]:
+    def _apply_nms(self, batch: DetectionBatch) -> DetectionBatch:
         """
         Non-Maximum Suppression (NMS) uygular.
 
@@ -150,39 +184,50 @@ class Postprocessor:
             İki kutunun kesişim alanı / birleşim alanı
             IoU > nms_threshold → kutular "aynı nesne" kabul edilir
 
-        NOT: OpenCV'nin cv2.dnn.NMSBoxes fonksiyonu kullanılır —
-        verimli C++ implementasyonudur.
+        Uygulama:
+            - numba kuruluysa: core.detection.nms.nms_kernel (JIT derlenmiş,
+              batch dizilerini kopyasız alır — liste dönüşümü yok)
+            - değilse: OpenCV'nin cv2.dnn.NMSBoxes fonksiyonu (C++)
+            İkisi de aynı tespitleri tutar.
+            - nms_method="fast": core.detection.nms.fast_nms (vektörel
+              Fast NMS — greedy'den biraz farklı sonuç verebilir)
 
         Args:
-            detections: Güven ve boyut filtrelerini geçmiş tespitler.
+            batch: Güven ve boyut filtrelerini geçmiş tespitler.
 
         Returns:
             NMS sonrası kalan tespitler (çakışmalar elenmiş).
         """
-        # Detection listesini numpy array'lere dönüştür
-        # (OpenCV NMS bu formatı bekler)
-        boxes = np.array(
-            [[d.x, d.y, d.w, d.h] for d in detections], dtype=np.int32
-        )
-        confidences = np.array(
-            [d.confidence for d in detections], dtype=np.float32
-        )
-
-        # OpenCV NMS çağrısı
+        # Fast NMS — saf numpy IoU matrisi, liste dönüşümü yok
+        if self._fast_nms:
+            keep = fast_nms(
+                batch.boxes, batch.confidences, self._config.nms_threshold
+            )
+            return batch.select(keep)
+
+        # JIT çekirdeği — boxes/confidences dizileri doğrudan verilir.
+        # Güven eşiği process() içinde zaten uygulandığı için tekrar bakılmaz.
+        if NUMBA_AVAILABLE:
+            keep = nms_kernel(
+                batch.boxes, batch.confidences, self._config.nms_threshold
+            )
+            return batch.select(keep)
+
+        # OpenCV NMS çağrısı (numba yoksa) — Python listesi bekler
         # bboxes: [x, y, w, h] formatında kutu listesi
         # scores: Her kutunun güven skoru
         # score_threshold: Bu altındakiler doğrudan elenir
         # nms_threshold: IoU eşiği (bu üstünde çakışanlar elenir)
         indices = cv2.dnn.NMSBoxes(
-            bboxes=boxes.tolist(),
-            scores=confidences.tolist(),
+            bboxes=batch.boxes.tolist(),
+            scores=batch.confidences.tolist(),
             score_threshold=self._config.confidence_threshold,
             nms_threshold=self._config.nms_threshold,
         )
 
-        # NMS hiç kutu bırakmadıysa boş liste döndür
+        # NMS hiç kutu bırakmadıysa boş batch döndür
         if len(indices) == 0:
-            return []
+            return DetectionBatch.empty()
 
         # indices farklı OpenCV sürümlerinde farklı boyutta olabilir
         # (eski sürümler: [[0], [2], [5]], yeni sürümler: [0, 2, 5])
@@ -190,4 +235,4 @@ class Postprocessor:
         indices = np.array(indices).flatten()
 
         # Yalnızca NMS'ten geçen tespitleri döndür
-        return [detections[i] for i in indices]
+        return batch.select(indices)
@@ -11,8 +11,26 @@ doğru çalışabilmesi için görüntü kalitesini iyileştirir.
     4. sharpen  → Kenar bilgisini güçlendirme (HOG kenar tabanlıdır)
     5. gray     → (Opsiyonel) Gri tonlama dönüşümü
 
+Veri tipi:
+    Tüm ara adımlar ve çıktı CV_8U (uint8) kalır — filter2D ddepth=-1 ile
+    çağrılır, ara tamponlar uint8'dir; float ara görüntü üretilmez.
+
+Gri çıktı seçildiğinde gri dönüşüm resize'dan hemen sonra yapılır ve
+sonraki adımlar tek kanal üzerinde çalışır (bkz. Preprocessor._build_steps).
+
 Her adım konfigürasyondan bağımsız olarak etkinleştirilebilir/devre dışı bırakılabilir.
 
+GPU (CUDA) Arka Ucu:
+    PreprocessConfig.use_cuda=True ve CUDA destekli bir GPU varsa aynı zincir
+    cv2.cuda filtreleriyle GPU belleğinde çalışır (bkz. _build_cuda_steps).
+    Filtre nesneleri bir kez oluşturulur; kare başına bir yükleme ve bir
+    indirme yapılır. GPU bulunamazsa CPU zincirine dönülür.
+
+OpenCL (T-API) Arka Ucu:
+    PreprocessConfig.use_opencl=True ve bir OpenCL cihazı varsa kare bir kez
+    cv2.UMat'a sarılır ve zincir UMat üzerinde çalışır; OpenCV işlemleri
+    OpenCL çekirdeklerine aktarır (bkz. _build_opencl_steps).
+
 Neden Bu Adımlar Önemli?
     - HOG dedektörü kenar yönelimlerine (gradient) dayalıdır
     - Bulanık/gürültülü görüntüler → zayıf gradientler → kaçırılan tespitler
@@ -20,14 +38,24 @@ Neden Bu Adımlar Önemli?
     - Ön-işleme bu sorunları dedektöre girmeden ÖNCE çözer
 """
 
+from typing import Callable, List, Optional
+
 import cv2
 import numpy as np
 
 from config.settings import PreprocessConfig
 from utils.logger import get_logger
+from utils.opencv_runtime import configure_opencv
 
 logger = get_logger(__name__)
 
+# Renkli CLAHE için desteklenen renk uzayları: (ileri, geri) dönüşüm kodları.
+# Her iki uzayda da parlaklık kanalı 0. kanaldır (L / Y).
+CLAHE_COLOR_SPACES = {
+    "lab": (cv2.COLOR_BGR2LAB, cv2.COLOR_LAB2BGR),
+    "ycrcb": (cv2.COLOR_BGR2YCrCb, cv2.COLOR_YCrCb2BGR),
+}
+
 
 class Preprocessor:
     """
@@ -43,13 +71,36 @@ class Preprocessor:
 
         Args:
             config: Ön-işleme konfigürasyonu.
+
+        Raises:
+            ValueError: sharpen_strength [0, 1] aralığı dışındaysa veya
+                clahe_color_space desteklenmiyorsa.
         """
+        # strength > 1 → merkez ağırlığı 5'i aşar, uint8 çıktıda kenarlar
+        # doyuma (0/255) gider; negatif değer bulanıklaştırır
+        if not 0.0 <= config.sharpen_strength <= 1.0:
+            raise ValueError(
+                f"sharpen_strength [0, 1] aralığında olmalı: {config.sharpen_strength}"
+            )
+        if config.clahe_color_space not in CLAHE_COLOR_SPACES:
+            raise ValueError(
+                f"Desteklenmeyen clahe_color_space: {config.clahe_color_space} "
+                f"(seçenekler: {', '.join(CLAHE_COLOR_SPACES)})"
+            )
         self._config = config
 
+        # OpenCV SIMD/HAL yolları ve thread sayısı (süreç başına bir kez)
+        configure_opencv()
+
         # Ölçekleme faktörü — resize sırasında hesaplanır,
         # sonradan koordinat dönüşümü için saklanır
         self._scale_factor: float = 1.0
 
+        # Kare başına okunan config alanları — config frozen olduğu için
+        # bir kez yerel özniteliğe alınır (self._config.x zinciri yerine)
+        self._target_width = config.target_width
+        self._pyramid_downscale = config.pyramid_downscale
+
         # --- CLAHE nesnesi ---
         # CLAHE'yi her frame'de yeniden oluşturmak pahalıdır,
         # bu yüzden bir kez oluşturup tekrar kullanırız
@@ -60,22 +111,63 @@ class Preprocessor:
                 tileGridSize=config.clahe_grid_size, # Bölge ızgarası (lokal işlem boyutu)
             )
 
+        # Renkli CLAHE dönüşüm kodları (LAB veya YCrCb) — bir kez seçilir
+        self._clahe_to, self._clahe_from = CLAHE_COLOR_SPACES[
+            config.clahe_color_space
+        ]
+
+        # LAB/YCrCb dönüşüm tamponu — ilk CLAHE çağrısında kare boyutuna
+        # göre oluşturulur ve sonraki karelerde yeniden kullanılır
+        self._lab_buf: np.ndarray = None
+
         # --- Keskinleştirme çekirdeği ---
-        # Konvolüsyon kerneli bir kez hesaplanır, her frame'de uygulanır
+        # Konvolüsyon kerneli bir kez hesaplanır, her frame'de uygulanır.
+        # strength=0 → çekirdek birim matristir (görüntüyü değiştirmez);
+        # bu durumda filter2D taraması tamamen atlanır.
         self._sharpen_kernel: np.ndarray = None
-        if config.enable_sharpening:
+        self._sharpen_enabled = (
+            config.enable_sharpening and config.sharpen_strength != 0.0
+        )
+        if self._sharpen_enabled:
             self._sharpen_kernel = self._build_sharpen_kernel(
                 config.sharpen_strength
             )
 
+        # --- Gürültü azaltma çekirdek boyutu ---
+        # OpenCV GaussianBlur tek sayı kernel gerektirir (3, 5, 7...);
+        # çift sayı girilirse +1 ile düzeltilir. Config frozen olduğu için
+        # düzeltme her karede değil, burada bir kez yapılır.
+        k = config.denoise_strength
+        self._denoise_ksize = (k + 1, k + 1) if k % 2 == 0 else (k, k)
+
+        # Ara adımların ping-pong tamponları — ilk karede boyuta göre
+        # oluşturulur ve sonraki karelerde yeniden kullanılır (bkz. process)
+        self._bufs: List[Optional[np.ndarray]] = [None, None]
+
+        # Piramit küçültme ara tamponları (seviye başına bir tane) —
+        # kaynak çözünürlüğü değişince yeniden oluşturulur (bkz. _pyr_down)
+        self._pyr_bufs: List[np.ndarray] = []
+
+        # Resize sonrası çalışacak adımlar — config'e göre bir kez sıralanır
+        self._steps = self._build_steps()
+
+        # GPU istendiyse ve kullanılabilirse CUDA zinciri kurulur
+        self._cuda = config.use_cuda and self._initialize_cuda()
+
+        # CUDA yoksa ve istendiyse OpenCL (T-API) zinciri kurulur
+        self._opencl = (
+            not self._cuda and config.use_opencl and self._initialize_opencl()
+        )
+
         # Başlatma bilgisi logla
         logger.info(
             "Preprocessor başlatıldı | Genişlik: %d | CLAHE: %s | "
-            "Keskinleştirme: %s | Gürültü azaltma: %s",
+            "Keskinleştirme: %s | Gürültü azaltma: %s | backend: %s",
             config.target_width,
             config.enable_clahe,
             config.enable_sharpening,
             config.enable_denoising,
+            "cuda" if self._cuda else "opencl" if self._opencl else "cpu",
         )
 
     def process(self, frame: np.ndarray) -> np.ndarray:
@@ -88,34 +180,305 @@ class Preprocessor:
             CLAHE   → Kontrast iyileştirme
             sharpen → Keskinleştirme (son adım — önceki adımların bulanıklığını telafi eder)
 
+        Gri çıktı isteniyorsa gri dönüşüm resize'dan hemen sonra yapılır
+        ve sonraki adımlar tek kanal üzerinde çalışır (bkz. _build_steps).
+
+        Bellek notu:
+            Ara adımlar iki kalıcı tampona sırayla (ping-pong) yazar — her
+            adım bir önceki adımın tamponundan okur, diğerine yazar. Yalnızca
+            SON adım yeni bir dizi üretir; döndürülen kare çağırana aittir ve
+            sonraki karede üzerine yazılmaz.
+
         Args:
             frame: BGR formatında girdi frame (orijinal boyut).
 
         Returns:
             İşlenmiş frame (boyutu küçültülmüş olabilir).
         """
+        if self._cuda:
+            return self._process_cuda(frame)
+        if self._opencl:
+            return self._process_opencl(frame)
+
+        steps = self._steps
+        last = len(steps)
+
         # 1. Boyut küçültme — hem performans hem de HOG pencere boyutu uyumu için
-        processed = self._resize(frame)
+        processed = self._resize(frame, 0 if last else None)
+
+        # 2+. Etkin adımlar sırayla — son adım tampon yerine yeni dizi üretir
+        for i, step in enumerate(steps, 1):
+            processed = step(processed, i % 2 if i < last else None)
+
+        return processed
 
-        # 2. Gürültü azaltma — CLAHE'den önce uygulanmalı
-        if self._config.enable_denoising:
-            processed = self._denoise(processed)
+    def _build_steps(self) -> List[Callable]:
+        """
+        Konfigürasyona göre resize sonrası çalışacak adımları sıralar.
+
+        Config frozen olduğu için liste bir kez (constructor'da) kurulur;
+        process() her karede etkin/pasif kontrolü yapmaz.
+
+        Renkli zincir: denoise → CLAHE (LAB) → sharpen
+        Gri zincir:    gray → denoise → CLAHE (tek kanal) → sharpen
+            Renk bilgisi sonunda atılacağı için gri dönüşüm en başta yapılır;
+            CLAHE doğrudan gri kanala uygulanır — BGR↔LAB dönüşümleri
+            yapılmaz. Tek kanallı blur/konvolüsyon ~3 kat az veri taşır.
+            NOT: Sonuç, renkli zincirin çıktısının griye çevrilmesiyle birebir
+            aynı değildir (CLAHE LAB L kanalı yerine gri kanala uygulanır);
+            HOG için ikisi de eşdeğer kontrast iyileştirmesi sağlar.
+        """
+        config = self._config
+        gray = config.convert_to_gray
+        steps: List[Callable] = []
+
+        if gray:
+            steps.append(self._to_gray)
+
+        # Gürültü azaltma — CLAHE'den önce uygulanmalı
+        if config.enable_denoising:
+            steps.append(self._denoise)
+
+        # CLAHE — kontrast iyileştirme (gölgeli alanları aydınlatır)
+        if config.enable_clahe:
+            steps.append(self._apply_clahe_gray if gray else self._apply_clahe)
+
+        # Keskinleştirme — kenar bilgisini güçlendirir
+        if self._sharpen_enabled:
+            steps.append(self._sharpen)
+
+        return steps
+
+    def _initialize_cuda(self) -> bool:
+        """
+        GPU filtre nesnelerini ve kalıcı stream/tamponları oluşturur.
+
+        Returns:
+            CUDA arka ucu kurulduysa True, GPU yoksa False (CPU'ya dönülür).
+        """
+        if not hasattr(cv2, "cuda") or cv2.cuda.getCudaEnabledDeviceCount() == 0:
+            logger.warning(
+                "use_cuda=True fakat CUDA destekli GPU bulunamadı — "
+                "CPU ön-işleme kullanılıyor."
+            )
+            return False
 
-        # 3. CLAHE — kontrast iyileştirme (gölgeli alanları aydınlatır)
-        if self._config.enable_clahe:
-            processed = self._apply_clahe(processed)
+        self._stream = cv2.cuda_Stream()
+        self._gpu_src = cv2.cuda_GpuMat()
+        self._cuda_steps = self._build_cuda_steps()
+        return True
 
-        # 4. Keskinleştirme — kenar bilgisini güçlendirir
-        if self._config.enable_sharpening:
-            processed = self._sharpen(processed)
+    def _build_cuda_steps(self) -> List[Callable]:
+        """
+        CPU zincirinin (bkz. _build_steps) cv2.cuda karşılığını kurar.
+
+        CUDA doğrusal filtreleri 3 kanallı CV_8UC3 kabul etmez; bu yüzden
+        renkli zincir GPU üzerinde BGRA (CV_8UC4) olarak çalışır ve indirme
+        öncesi BGR'ye çevrilir. Her adım (gpu_mat) → gpu_mat biçimindedir
+        ve tüm işler aynı stream'e sıralanır.
+        """
+        config = self._config
+        stream = self._stream
+        gray = config.convert_to_gray
+        mat_type = cv2.CV_8UC1 if gray else cv2.CV_8UC4
+        if gray:
+            # Kare zaten tek kanallıysa (gri/IR kamera) dönüşüm atlanır —
+            # CPU _to_gray() ile aynı
+            steps: List[Callable] = [
+                lambda m: m if m.channels() == 1 else cv2.cuda.cvtColor(
+                    m, cv2.COLOR_BGR2GRAY, stream=stream
+                )
+            ]
+        else:
+            steps = [
+                lambda m: cv2.cuda.cvtColor(
+                    m, cv2.COLOR_BGR2BGRA, stream=stream
+                )
+            ]
+
+        if config.enable_denoising:
+            gauss = cv2.cuda.createGaussianFilter(
+                mat_type, mat_type, self._denoise_ksize, 0
+            )
+            steps.append(lambda m: gauss.apply(m, stream=stream))
+
+        if config.enable_clahe:
+            clahe = cv2.cuda.createCLAHE(
+                clipLimit=config.clahe_clip_limit,
+                tileGridSize=config.clahe_grid_size,
+            )
+            if gray:
+                steps.append(lambda m: clahe.apply(m, stream))
+            else:
+                to_space, from_space = self._clahe_to, self._clahe_from
+
+                def apply_clahe(m):
+                    # L/Y kanalına CLAHE uygula, diğer kanallar aynen kalır
+                    channels = cv2.cuda.split(
+                        cv2.cuda.cvtColor(m, to_space, stream=stream),
+                        stream=stream,
+                    )
+                    channels[0] = clahe.apply(channels[0], stream)
+                    return cv2.cuda.cvtColor(
+                        cv2.cuda.merge(channels, stream=stream),
+                        from_space, dcn=4, stream=stream,
+                    )
+
+                steps.append(apply_clahe)
+
+        if self._sharpen_enabled:
+            sharp = cv2.cuda.createLinearFilter(
+                mat_type, mat_type, self._sharpen_kernel
+            )
+            steps.append(lambda m: sharp.apply(m, stream=stream))
+
+        if not gray:
+            steps.append(
+                lambda m: cv2.cuda.cvtColor(m, cv2.COLOR_BGRA2BGR, stream=stream)
+            )
+        return steps
 
-        # 5. Gri tonlama dönüşümü (opsiyonel)
-        if self._config.convert_to_gray:
+    def _process_cuda(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Ön-işleme zincirini GPU üzerinde çalıştırır (bkz. _build_cuda_steps).
+
+        Kare bir kez yüklenir, tüm adımlar aynı stream'de sıralanır ve
+        sonuç stream tamamlandıktan sonra bir kez indirilir.
+        """
+        stream = self._stream
+        self._gpu_src.upload(frame, stream)
+        processed = self._gpu_src
+
+        # Boyut küçültme — ölçek faktörü ve interpolasyon CPU yolu ile aynı
+        size = self._target_size(frame)
+        if size is not None:
+            processed = cv2.cuda.resize(
+                processed, size[0], interpolation=size[1], stream=stream
+            )
+
+        for step in self._cuda_steps:
+            processed = step(processed)
+
+        result = processed.download(stream)
+        stream.waitForCompletion()
+        return result
+
+    def _initialize_opencl(self) -> bool:
+        """
+        OpenCL'i etkinleştirir ve UMat zincirini kurar.
+
+        Returns:
+            OpenCL cihazı varsa True, yoksa False (CPU'ya dönülür).
+        """
+        if not cv2.ocl.haveOpenCL():
+            logger.warning(
+                "use_opencl=True fakat OpenCL cihazı bulunamadı — "
+                "CPU ön-işleme kullanılıyor."
+            )
+            return False
+
+        cv2.ocl.setUseOpenCL(True)
+        self._opencl_steps = self._build_opencl_steps()
+        return True
+
+    def _build_opencl_steps(self) -> List[Callable]:
+        """
+        CPU zincirinin (bkz. _build_steps) UMat karşılığını kurar.
+
+        Aynı OpenCV fonksiyonları UMat ile çağrılır; numpy ping-pong
+        tamponları kullanılmaz — ara sonuçlar cihaz belleğinde kalır.
+        Her adım (umat) → umat biçimindedir.
+
+        Gri dönüşüm bu listede yer almaz: UMat kanal sayısını sunmadığı için
+        _process_opencl() kararı numpy karesinin boyutuna göre verir
+        (tek kanallı karede dönüşüm atlanır — CPU _to_gray() ile aynı).
+        """
+        config = self._config
+        gray = config.convert_to_gray
+        steps: List[Callable] = []
+
+        if config.enable_denoising:
+            ksize = self._denoise_ksize
+            steps.append(lambda m: cv2.GaussianBlur(m, ksize, 0))
+
+        if config.enable_clahe:
+            clahe = self._clahe
+            if gray:
+                steps.append(clahe.apply)
+            else:
+                to_space, from_space = self._clahe_to, self._clahe_from
+
+                def apply_clahe(m):
+                    # L/Y kanalına CLAHE uygula, diğer kanallar aynen kalır
+                    lab = cv2.cvtColor(m, to_space)
+                    cv2.insertChannel(
+                        clahe.apply(cv2.extractChannel(lab, 0)), lab, 0
+                    )
+                    return cv2.cvtColor(lab, from_space)
+
+                steps.append(apply_clahe)
+
+        if self._sharpen_enabled:
+            kernel = self._sharpen_kernel
+            steps.append(lambda m: cv2.filter2D(m, -1, kernel))
+
+        return steps
+
+    def _process_opencl(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Ön-işleme zincirini UMat (T-API) üzerinde çalıştırır.
+
+        Kare bir kez UMat'a sarılır; sonuç bir kez numpy dizisine alınır
+        (dedektör ve görselleştirici numpy bekler).
+        """
+        processed = cv2.UMat(frame)
+
+        # Boyut küçültme — ölçek faktörü ve interpolasyon CPU yolu ile aynı
+        size = self._target_size(frame)
+        if size is not None:
+            processed = cv2.resize(processed, size[0], interpolation=size[1])
+
+        # Gri dönüşüm — kare zaten tek kanallıysa (gri/IR kamera) atlanır
+        if self._config.convert_to_gray and frame.ndim == 3:
             processed = cv2.cvtColor(processed, cv2.COLOR_BGR2GRAY)
 
-        return processed
+        for step in self._opencl_steps:
+            processed = step(processed)
 
-    def _resize(self, frame: np.ndarray) -> np.ndarray:
+        return processed.get()
+
+    def _buffer(self, slot: Optional[int], shape: tuple) -> Optional[np.ndarray]:
+        """
+        Ara adım için kalıcı tamponu döndürür (slot None → None).
+
+        OpenCV'ye dst=None verildiğinde yeni dizi ayrılır; bu yüzden son
+        adım slot=None ile çağrılır. Tampon kare boyutu değiştiğinde
+        yeniden oluşturulur.
+        """
+        if slot is None:
+            return None
+        buf = self._bufs[slot]
+        if buf is None or buf.shape != shape:
+            buf = self._bufs[slot] = np.empty(shape, dtype=np.uint8)
+        return buf
+
+    def _to_gray(self, frame: np.ndarray, slot: Optional[int] = None) -> np.ndarray:
+        """
+        BGR → gri tonlama dönüşümü (gri zincirin ilk adımı).
+
+        Kare zaten tek kanallıysa (ör. gri/IR kamera) dönüşüm yapılmaz;
+        yalnızca hedef tampona kopyalanır — sonraki adım kendi girdisinin
+        üzerine yazmaz ve son adımın çıktısı yine çağırana ait yeni dizi olur.
+        """
+        dst = self._buffer(slot, frame.shape[:2])
+        if frame.ndim == 2:
+            if dst is None:
+                return frame.copy()
+            np.copyto(dst, frame)
+            return dst
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=dst)
+
+    def _resize(self, frame: np.ndarray, slot: Optional[int] = None) -> np.ndarray:
         """
         En-boy oranını koruyarak yeniden boyutlandırır.
 
@@ -128,26 +491,75 @@ class Preprocessor:
         NOT: Ölçekleme faktörü saklanır — tespit koordinatlarını
         orijinal boyuta geri dönüştürmek için gereklidir.
         """
-        height, width = frame.shape[:2]
+        size = self._target_size(frame)
 
         # Eğer frame zaten hedef genişlikten küçükse, resize yapma
-        if width <= self._config.target_width:
-            self._scale_factor = 1.0
+        if size is None:
             return frame
+        (target_width, new_height), interpolation = size
 
-        # Ölçekleme faktörünü hesapla (0-1 arası)
-        self._scale_factor = self._config.target_width / width
-        new_height = int(height * self._scale_factor)
+        # Opsiyonel piramit yolu: 2 kattan fazla küçültmede pyrDown ile
+        # yarıya inilir, kalan (< 2x) oran INTER_LINEAR ile tamamlanır
+        if self._pyramid_downscale and self._scale_factor < 0.5:
+            frame = self._pyr_down(frame)
+            interpolation = cv2.INTER_LINEAR
 
-        # INTER_AREA: Küçültme için en iyi interpolasyon yöntemi
-        # (piksel bilgisini korur, moiré efekti önler)
         return cv2.resize(
             frame,
-            (self._config.target_width, new_height),
-            interpolation=cv2.INTER_AREA,
+            (target_width, new_height),
+            dst=self._buffer(slot, (new_height, target_width) + frame.shape[2:]),
+            interpolation=interpolation,
         )
 
-    def _denoise(self, frame: np.ndarray) -> np.ndarray:
+    def _target_size(self, frame: np.ndarray) -> Optional[tuple]:
+        """
+        Ölçek faktörünü günceller ve ((genişlik, yükseklik), interpolasyon)
+        döndürür; kare zaten hedef genişlikteyse veya küçükse None.
+        """
+        height, width = frame.shape[:2]
+        target_width = self._target_width
+        if width <= target_width:
+            self._scale_factor = 1.0
+            return None
+
+        # Ölçekleme faktörünü hesapla (0-1 arası)
+        scale = self._scale_factor = target_width / width
+        new_height = int(height * scale)
+
+        # Interpolasyon seçimi:
+        #   - Ölçek ≤ 0.5 (≥2x küçültme): INTER_AREA — küçültme için en iyi
+        #     yöntem (piksel bilgisini korur, moiré efekti önler). Tam 2x'te
+        #     OpenCV'nin hızlı tamsayı yolu kullanılır.
+        #   - 0.5 < ölçek < 1 (ör. 960 → 640): INTER_AREA tamsayı olmayan
+        #     oranda yavaş genel yola düşer; bu aralıkta örnekleme adımı
+        #     pikselden kısa olduğundan INTER_LINEAR belirgin aliasing
+        #     üretmez ve birkaç kat hızlıdır.
+        interpolation = cv2.INTER_LINEAR if scale > 0.5 else cv2.INTER_AREA
+        return (target_width, new_height), interpolation
+
+    def _pyr_down(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Kareyi hedef genişliğin altına inmeden pyrDown ile yarılar.
+
+        pyrDown 5x5 Gaussian + 2x alt örnekleme yapan, SIMD optimize sabit
+        oranlı bir çekirdektir; büyük oranlarda INTER_AREA'nın genel
+        (tamsayı olmayan) yolundan hızlıdır. Her seviye kalıcı bir tampona
+        yazılır — tamponlar kaynak çözünürlüğü değişince yeniden oluşturulur.
+        """
+        target = self._target_width
+        level = 0
+        while frame.shape[1] >= 2 * target:
+            height, width = frame.shape[:2]
+            shape = ((height + 1) // 2, (width + 1) // 2) + frame.shape[2:]
+            if level == len(self._pyr_bufs):
+                self._pyr_bufs.append(np.empty(shape, dtype=np.uint8))
+            elif self._pyr_bufs[level].shape != shape:
+                self._pyr_bufs[level] = np.empty(shape, dtype=np.uint8)
+            frame = cv2.pyrDown(frame, dst=self._pyr_bufs[level])
+            level += 1
+        return frame
+
+    def _denoise(self, frame: np.ndarray, slot: Optional[int] = None) -> np.ndarray:
         """
         Hafif Gaussian blur ile gürültü azaltma.
 
@@ -158,15 +570,13 @@ class Preprocessor:
 
         Kernel boyutu kuralı:
             - OpenCV GaussianBlur tek sayı kernel gerektirir (3, 5, 7...)
-            - Çift sayı girilirse +1 ile düzeltilir
+            - Çift sayı girilirse +1 ile düzeltilir (constructor'da bir kez)
         """
-        k = self._config.denoise_strength
-        # Kernel boyutu tek sayı olmalı (OpenCV gereksinimi)
-        if k % 2 == 0:
-            k += 1
-        return cv2.GaussianBlur(frame, (k, k), 0)
+        return cv2.GaussianBlur(
+            frame, self._denoise_ksize, 0, dst=self._buffer(slot, frame.shape)
+        )
 
-    def _apply_clahe(self, frame: np.ndarray) -> np.ndarray:
+    def _apply_clahe(self, frame: np.ndarray, slot: Optional[int] = None) -> np.ndarray:
         """
         CLAHE (Contrast Limited Adaptive Histogram Equalization) uygular.
 
@@ -181,19 +591,41 @@ class Preprocessor:
             - LAB uzayında L (aydınlık) kanalına CLAHE uygulanır
             - A (kırmızı-yeşil) ve B (mavi-sarı) kanalları korunur
             - Sonuç: Doğal renklerde iyileştirilmiş kontrast
+
+        Performans notu:
+            A ve B kanalları hiç değişmediği için split/merge yapılmaz.
+            LAB görüntü kalıcı bir tampona yazılır, yalnızca L kanalı
+            çıkarılıp (extractChannel) geri yazılır (insertChannel).
+            Kare başına üç kanal kopyası ve iki tam boy ara dizi üretilmez.
+
+            clahe_color_space="ycrcb" ile LAB yerine YCrCb kullanılır: Y
+            kanalı doğrusal (sabit noktalı) bir dönüşümdür; LAB'ın piksel
+            başına küp kökü hesabı olmadığından dönüşümler ~3 kat hızlıdır.
         """
-        # BGR → LAB dönüşümü
-        lab = cv2.cvtColor(frame, cv2.COLOR_BGR2LAB)
-        l_channel, a_channel, b_channel = cv2.split(lab)
+        # LAB tamponu kare boyutu değiştiyse yeniden oluşturulur
+        if self._lab_buf is None or self._lab_buf.shape != frame.shape:
+            self._lab_buf = np.empty_like(frame)
+        lab = self._lab_buf
+
+        # BGR → LAB/YCrCb dönüşümü (kalıcı tampona)
+        cv2.cvtColor(frame, self._clahe_to, dst=lab)
+
+        # Yalnızca L/Y (aydınlık) kanalına CLAHE uygula ve yerine yaz
+        l_channel = self._clahe.apply(cv2.extractChannel(lab, 0))
+        cv2.insertChannel(l_channel, lab, 0)
 
-        # Yalnızca L (aydınlık) kanalına CLAHE uygula
-        l_channel = self._clahe.apply(l_channel)
+        # BGR'ye geri dönüştür — dönüşüm tamponu dışarı verilmez
+        return cv2.cvtColor(
+            lab, self._clahe_from, dst=self._buffer(slot, frame.shape)
+        )
 
-        # Kanalları birleştir ve BGR'ye geri dönüştür
-        lab = cv2.merge([l_channel, a_channel, b_channel])
-        return cv2.cvtColor(lab, cv2.COLOR_LAB2BGR)
+    def _apply_clahe_gray(
+        self, frame: np.ndarray, slot: Optional[int] = None
+    ) -> np.ndarray:
+        """CLAHE'yi doğrudan tek kanallı (gri) kareye uygular — LAB gerekmez."""
+        return self._clahe.apply(frame, dst=self._buffer(slot, frame.shape))
 
-    def _sharpen(self, frame: np.ndarray) -> np.ndarray:
+    def _sharpen(self, frame: np.ndarray, slot: Optional[int] = None) -> np.ndarray:
         """
         Unsharp Mask tabanlı keskinleştirme uygular.
 
@@ -204,8 +636,17 @@ class Preprocessor:
 
         Çekirdek (kernel), 2D konvolüsyon ile her pikseli
         komşularının ağırlıklı ortalaması ile değiştirir.
+
+        Performans notu:
+            Çekirdek I + 4·s·(I − komşu4_ortalaması) biçimindedir; yani
+            4-komşu ortalamalı bir unsharp mask'tır. GaussianBlur +
+            addWeighted ile yazılan unsharp mask bu sonucu birebir vermez
+            ve 640x360 BGR karede iki tam tarama yaptığı için tek filter2D
+            çağrısından yavaştır — tek geçişli filter2D korunur.
         """
-        return cv2.filter2D(frame, -1, self._sharpen_kernel)
+        return cv2.filter2D(
+            frame, -1, self._sharpen_kernel, dst=self._buffer(slot, frame.shape)
+        )
 
     @staticmethod
     def _build_sharpen_kernel(strength: float) -> np.ndarray:
@@ -31,6 +31,9 @@ class VideoSource(ABC):
         - is_opened(): Durum kontrolü
         - fps (property): Saniyedeki kare sayısı
         - frame_size (property): Çözünürlük
+
+    Opsiyonel override:
+        - skip_frames(): Kareleri çözmeden atlama (varsayılan: read_frame)
     """
 
     @abstractmethod
@@ -54,6 +57,25 @@ class VideoSource(ABC):
     def is_opened(self) -> bool:
         """Kaynağın açık ve okumaya hazır olup olmadığını döndürür."""
 
+    def skip_frames(self, count: int) -> int:
+        """
+        Sonraki `count` kareyi işlemeden atlar.
+
+        Varsayılan implementasyon kareleri read_frame() ile okuyup atar.
+        VideoCapture tabanlı kaynaklar bunu grab() ile override eder —
+        kare çözülmez (decode/BGR dönüşümü yapılmaz) ve kopyalanmaz.
+
+        Args:
+            count: Atlanacak kare sayısı.
+
+        Returns:
+            Gerçekten atlanan kare sayısı (kaynak biterse count'tan az).
+        """
+        for skipped in range(count):
+            if self.read_frame() is None:
+                return skipped
+        return count
+
     @property
     @abstractmethod
     def fps(self) -> float:
@@ -9,6 +9,9 @@ Kullanım:
     with source:
         frame = source.read_frame()
         # frame ile tespit yap...
+
+    # MJPG formatında, ön-işleme genişliğine yakın çözünürlükte yakalama
+    source = CameraSource(camera_index=0, capture_width=640, fourcc="MJPG")
 """
 
 from typing import Optional
@@ -30,14 +33,37 @@ class CameraSource(VideoSource):
     varsayılan 30.0 kullanılır ve gerçek FPS, FPSCounter ile ölçülür.
     """
 
-    def __init__(self, camera_index: int = 0) -> None:
+    def __init__(
+        self,
+        camera_index: int = 0,
+        capture_width: int = 0,
+        fourcc: Optional[str] = None,
+        buffer_size: int = 0,
+    ) -> None:
         """
         Args:
             camera_index: Kamera cihaz indeksi.
                 0 = birincil kamera (dahili webcam),
                 1 = ikincil kamera (harici USB kamera), vb.
+            capture_width: İstenen yakalama genişliği (piksel). 0 → kameranın
+                varsayılan modu. Genelde ön-işleme target_width'i verilir;
+                kamera desteklediği en yakın modu seçer.
+            fourcc: İstenen piksel formatı (ör. "MJPG", "YUY2"). None →
+                kameranın varsayılanı. MJPG sıkıştırılmış kare gönderir —
+                USB bant genişliği ve ham kare kopyası azalır.
+            buffer_size: Sürücü kare tamponu boyutu (CAP_PROP_BUFFERSIZE).
+                0 → varsayılan (genelde 3-5 kare). 1 → her okuma en taze
+                kareyi verir; işleme yavaşken gecikme birikmez.
+
+        Raises:
+            ValueError: fourcc 4 karakter değilse.
         """
+        if fourcc is not None and len(fourcc) != 4:
+            raise ValueError(f"fourcc 4 karakter olmalı: {fourcc!r}")
         self._camera_index = camera_index
+        self._capture_width = capture_width
+        self._fourcc = fourcc
+        self._buffer_size = buffer_size
         self._capture: Optional[cv2.VideoCapture] = None
 
         # Kamera FPS değeri — donanımdan okunamazsa 30.0 varsayılır
@@ -45,6 +71,10 @@ class CameraSource(VideoSource):
         self._width: int = 0
         self._height: int = 0
 
+        # Açık durumu — read_frame() her karede isOpened() FFI çağrısı
+        # yapmak yerine bu bayrağı kontrol eder
+        self._is_open: bool = False
+
     def open(self) -> None:
         """
         Kamerayı açar ve çözünürlük bilgilerini okur.
@@ -61,18 +91,36 @@ class CameraSource(VideoSource):
                 "Kameranın bağlı ve kullanılabilir olduğundan emin olun."
             )
 
+        # İstenen format/çözünürlük — çözünürlükten ÖNCE format ayarlanır,
+        # çünkü bazı sürücüler kullanılabilir modları formata göre listeler
+        if self._fourcc is not None:
+            self._capture.set(
+                cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*self._fourcc)
+            )
+        if self._capture_width > 0:
+            self._capture.set(cv2.CAP_PROP_FRAME_WIDTH, self._capture_width)
+        # Tüm backend'ler desteklemez — desteklenmiyorsa set() False döner
+        if self._buffer_size > 0:
+            self._capture.set(cv2.CAP_PROP_BUFFERSIZE, self._buffer_size)
+
         # FPS değerini oku — bazı kameralar 0 döndürür, bu durumda 30.0 kullan
         self._fps_value = self._capture.get(cv2.CAP_PROP_FPS) or 30.0
         self._width = int(self._capture.get(cv2.CAP_PROP_FRAME_WIDTH))
         self._height = int(self._capture.get(cv2.CAP_PROP_FRAME_HEIGHT))
 
+        # Kameranın gerçekte kabul ettiği format (istenenle aynı olmayabilir)
+        code = int(self._capture.get(cv2.CAP_PROP_FOURCC))
+        negotiated = "".join(chr((code >> (8 * i)) & 0xFF) for i in range(4))
+
         logger.info(
-            "Kamera açıldı (index: %d) | %dx%d | %.1f FPS",
+            "Kamera açıldı (index: %d) | %dx%d | %.1f FPS | format: %s",
             self._camera_index,
             self._width,
             self._height,
             self._fps_value,
+            negotiated if code else "?",
         )
+        self._is_open = True
 
     def read_frame(self) -> Optional[np.ndarray]:
         """
@@ -81,14 +129,32 @@ class CameraSource(VideoSource):
         Returns:
             BGR numpy array veya okuma başarısızsa None.
         """
-        if self._capture is None or not self._capture.isOpened():
+        if not self._is_open:
             return None
 
+        # Başarısız okuma kamerayı kapalı saymaz — geçici olabilir
         ret, frame = self._capture.read()
         return frame if ret else None
 
+    def skip_frames(self, count: int) -> int:
+        """
+        Sonraki `count` kareyi grab() ile çözmeden atlar.
+
+        Args:
+            count: Atlanacak kare sayısı.
+
+        Returns:
+            Gerçekten atlanan kare sayısı (grab başarısızsa count'tan az).
+        """
+        for skipped in range(count):
+            # Başarısız grab kamerayı kapalı saymaz — read_frame() ile aynı
+            if not self._is_open or not self._capture.grab():
+                return skipped
+        return count
+
     def release(self) -> None:
         """Kamerayı serbest bırakır ve kaynakları temizler."""
+        self._is_open = False
         if self._capture is not None:
             self._capture.release()
             self._capture = None
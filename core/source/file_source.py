@@ -17,8 +17,9 @@ Desteklenen formatlar:
             # frame ile işlem yap...
 """
 
+import os
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
 import cv2
 import numpy as np
@@ -37,7 +38,7 @@ class FileVideoSource(VideoSource):
     hemen FileNotFoundError fırlatılır (fail-fast prensibi).
     """
 
-    def __init__(self, file_path: str) -> None:
+    def __init__(self, file_path: Union[str, os.PathLike]) -> None:
         """
         Video kaynağını dosya yolu ile oluşturur.
 
@@ -47,11 +48,14 @@ class FileVideoSource(VideoSource):
         Raises:
             FileNotFoundError: Dosya bulunamazsa.
         """
-        # Path nesnesi — platform bağımsız dosya yolu yönetimi
-        self._file_path = Path(file_path)
-
-        # Dosya varlık kontrolü — erken başarısızlık (fail-fast)
-        if not self._file_path.exists():
+        # Dosya yolu str olarak saklanır — VideoCapture doğrudan str bekler,
+        # her open()'da Path → str dönüşümü yapılmaz
+        self._file_path = os.fspath(file_path)
+        self._name = os.path.basename(self._file_path)  # Log mesajları için
+
+        # Dosya varlık kontrolü — erken başarısızlık (fail-fast).
+        # isfile(): tek stat çağrısı; dizin yolları da reddedilir
+        if not os.path.isfile(self._file_path):
             raise FileNotFoundError(f"Video dosyası bulunamadı: {file_path}")
 
         # OpenCV VideoCapture nesnesi — open() ile başlatılır
@@ -63,6 +67,10 @@ class FileVideoSource(VideoSource):
         self._height: int = 0               # Çözünürlük yüksekliği (piksel)
         self._total_frames: int = 0         # Toplam kare sayısı
 
+        # Açık durumu — read_frame() her karede isOpened() FFI çağrısı
+        # yapmak yerine bu bayrağı kontrol eder
+        self._is_open: bool = False
+
     def open(self) -> None:
         """
         Video dosyasını açar ve meta verileri okur.
@@ -76,7 +84,7 @@ class FileVideoSource(VideoSource):
             IOError: Dosya açılamazsa (bozuk dosya, desteklenmeyen codec vb.).
         """
         # VideoCapture ile dosyayı aç
-        self._capture = cv2.VideoCapture(str(self._file_path))
+        self._capture = cv2.VideoCapture(self._file_path)
 
         # Açılma kontrolü — codec hatası, izin sorunu vb. olabilir
         if not self._capture.isOpened():
@@ -90,12 +98,13 @@ class FileVideoSource(VideoSource):
 
         logger.info(
             "Video açıldı: %s | %dx%d | %.1f FPS | %d kare",
-            self._file_path.name,
+            self._name,
             self._width,
             self._height,
             self._fps_value,
             self._total_frames,
         )
+        self._is_open = True
 
     def read_frame(self) -> Optional[np.ndarray]:
         """
@@ -104,23 +113,47 @@ class FileVideoSource(VideoSource):
         Returns:
             BGR numpy array veya video bittiyse/hata olduysa None.
         """
-        # Kaynak açık değilse okuma yapma
-        if self._capture is None or not self._capture.isOpened():
+        # Kaynak açık değilse (veya video bittiyse) okuma yapma
+        if not self._is_open:
             return None
 
         # ret: Okuma başarılı mı? frame: BGR numpy array
         ret, frame = self._capture.read()
-        return frame if ret else None  # Video sonunda ret=False olur
+        if not ret:
+            # Video sonu — sonraki çağrılar read() yapmadan None döndürür
+            self._is_open = False
+            return None
+        return frame
+
+    def skip_frames(self, count: int) -> int:
+        """
+        Sonraki `count` kareyi grab() ile çözmeden atlar.
+
+        Args:
+            count: Atlanacak kare sayısı.
+
+        Returns:
+            Gerçekten atlanan kare sayısı (video biterse count'tan az).
+        """
+        for skipped in range(count):
+            if not self._is_open:
+                return skipped
+            if not self._capture.grab():
+                # Video sonu — read_frame() ile aynı şekilde kapalı sayılır
+                self._is_open = False
+                return skipped
+        return count
 
     def release(self) -> None:
         """
         VideoCapture nesnesini serbest bırakır.
         Dosya tanıtıcısı (file handle) serbest bırakılır.
         """
+        self._is_open = False
         if self._capture is not None:
             self._capture.release()
             self._capture = None
-            logger.info("Video kaynağı kapatıldı: %s", self._file_path.name)
+            logger.info("Video kaynağı kapatıldı: %s", self._name)
 
     def is_opened(self) -> bool:
         """VideoCapture'ın açık olup olmadığını döndürür."""
@@ -143,3 +176,8 @@ class FileVideoSource(VideoSource):
         İlerleme çubuğu veya rapor oluşturma için kullanılır.
         """
         return self._total_frames
+
+    @property
+    def path(self) -> Path:
+        """Video dosyasının yolunu Path nesnesi olarak döndürür."""
+        return Path(self._file_path)
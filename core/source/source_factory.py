@@ -12,6 +12,7 @@ Factory Pattern burada neden kullanılır?
 Kullanım:
     source = SourceFactory.create(SourceType.FILE, path="video.mp4")
     source = SourceFactory.create(SourceType.CAMERA, camera_index=0)
+    source = SourceFactory.create(SourceType.FILE, path="video.mp4", threaded=True)
 """
 
 from enum import Enum, auto
@@ -20,6 +21,7 @@ from typing import Optional
 from core.source.base_source import VideoSource
 from core.source.file_source import FileVideoSource
 from core.source.camera_source import CameraSource
+from core.source.threaded_source import ThreadedVideoSource
 
 
 class SourceType(Enum):
@@ -47,6 +49,10 @@ class SourceFactory:
         source_type: SourceType,
         path: Optional[str] = None,
         camera_index: int = 0,
+        threaded: bool = False,
+        camera_width: int = 0,
+        camera_fourcc: Optional[str] = None,
+        low_latency: bool = False,
     ) -> VideoSource:
         """
         Kaynak tipine göre uygun VideoSource nesnesi üretir.
@@ -55,22 +61,47 @@ class SourceFactory:
             source_type: Kaynak tipi enum'u (FILE veya CAMERA).
             path: Video dosya yolu (FILE tipi için zorunlu).
             camera_index: Kamera cihaz indeksi (CAMERA tipi için, varsayılan: 0).
+            threaded: True ise kaynak ThreadedVideoSource ile sarılır —
+                kareler arka plan thread'inde önceden okunur.
+            camera_width: İstenen kamera yakalama genişliği (0 → varsayılan).
+            camera_fourcc: İstenen kamera piksel formatı (ör. "MJPG").
+            low_latency: Yalnızca CAMERA için — sürücü tamponu 1 kareye
+                indirilir; threaded=True ise okuyucu eski kareleri düşürür
+                (1 karelik kuyruk) ve her zaman en taze kare işlenir.
 
         Returns:
-            VideoSource alt sınıfı (FileVideoSource veya CameraSource).
+            VideoSource alt sınıfı (FileVideoSource veya CameraSource;
+            threaded=True ise bunları saran ThreadedVideoSource).
 
         Raises:
             ValueError: Geçersiz kaynak tipi veya FILE seçilip path verilmezse.
         """
+        source: VideoSource
+
         # --- Dosya Kaynağı ---
         if source_type == SourceType.FILE:
             if path is None:
                 raise ValueError("FILE kaynağı için 'path' parametresi zorunludur.")
-            return FileVideoSource(path)
+            source = FileVideoSource(path)
 
         # --- Kamera Kaynağı ---
-        if source_type == SourceType.CAMERA:
-            return CameraSource(camera_index)
+        elif source_type == SourceType.CAMERA:
+            source = CameraSource(
+                camera_index,
+                capture_width=camera_width,
+                fourcc=camera_fourcc,
+                buffer_size=1 if low_latency else 0,
+            )
 
         # Bilinmeyen tip — gelecekte yeni tipler eklendiğinde buraya düşer
-        raise ValueError(f"Desteklenmeyen kaynak tipi: {source_type}")
+        else:
+            raise ValueError(f"Desteklenmeyen kaynak tipi: {source_type}")
+
+        # --- Arka Plan Okuma (Opsiyonel) ---
+        # Codec çözme işleme ile örtüşür (bkz. ThreadedVideoSource)
+        if threaded:
+            # Canlı kamerada düşük gecikme: 1 karelik kuyruk, eski kare atılır
+            if low_latency and source_type == SourceType.CAMERA:
+                return ThreadedVideoSource(source, queue_size=1, drop_stale=True)
+            return ThreadedVideoSource(source)
+        return source
@@ -0,0 +1,243 @@
+"""
+Arka Plan Thread'inde Okuyan Video Kaynağı
+============================================
+Herhangi bir VideoSource'u sarar ve kareleri ayrı bir thread'de
+önceden okur (prefetch). Ana thread kareyi işlerken bir sonraki
+kare(ler) zaten çözülmüş (decode) olarak kuyrukta bekler.
+
+Neden?
+    - VideoCapture.read() (codec çözme) ile ön-işleme/tespit aynı
+      thread'de sıralı çalışırsa çözme süresi her kareye eklenir
+    - read() C++ tarafında GIL'i bıraktığı için çözme ve işleme
+      gerçekten eş zamanlı ilerler
+    - Sınırlı (bounded) kuyruk bellek kullanımını sabitler; işleme
+      yavaşsa okuyucu thread bekler
+
+Eski Kareyi Düşürme (drop_stale):
+    Canlı kamerada ilgili kare EN TAZE karedir. drop_stale=True ile kuyruk
+    doluyken okuyucu beklemez; en eski kare atılır ve yeni kare eklenir.
+    İşleme yavaş olsa da gecikme kuyruk boyutuyla sınırlı kalır.
+    Dosya kaynağında kullanılmamalıdır (kareler atlanır).
+
+Kullanım:
+    source = ThreadedVideoSource(FileVideoSource("video.mp4"))
+    with source:
+        frame = source.read_frame()
+
+    # Canlı kamera — düşük gecikme (yalnızca en taze kare)
+    source = ThreadedVideoSource(CameraSource(0), queue_size=1, drop_stale=True)
+
+Kare Atlama (frame_stride):
+    set_frame_stride(N) ile okuyucu thread her okunan kareden sonra N - 1
+    kareyi sarılan kaynağın skip_frames() metoduyla (dosya/kamerada grab(),
+    çözmeden) atlar. Atlanan kareler hiç çözülmez ve kuyruğa girmez;
+    skip_frames() okuyucunun o kareden sonra atladığı sayıyı döndürür —
+    pipeline kare numaralarını değiştirmeden sayar.
+
+NOT: cv2.setNumThreads OpenCV'nin süreç geneli thread havuzunu ayarlar;
+okuyucu thread için ayrıca çağrılmaz (tüm işlemeyi tek thread'e düşürürdü).
+"""
+
+import queue
+import threading
+from typing import Optional, Tuple
+
+import numpy as np
+
+from core.source.base_source import VideoSource
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Kuyruk/durma kontrolü arasındaki bekleme süresi (saniye)
+_POLL_INTERVAL = 0.1
+
+
+class ThreadedVideoSource(VideoSource):
+    """
+    Kareleri arka plan thread'inde okuyan VideoSource sarmalayıcısı.
+
+    Kaynağa özgü öznitelikler (total_frames, _file_path vb.) sarılan
+    kaynağa yönlendirilir — pipeline ve raporlama değişmeden çalışır.
+    """
+
+    def __init__(
+        self, source: VideoSource, queue_size: int = 4, drop_stale: bool = False
+    ) -> None:
+        """
+        Args:
+            source: Sarılacak video kaynağı (dosya veya kamera).
+            queue_size: Önceden okunacak en fazla kare sayısı.
+            drop_stale: True ise kuyruk doluyken en eski kare atılır
+                (canlı kaynaklar için düşük gecikme modu).
+        """
+        self._source = source
+        self._drop_stale = drop_stale
+        # Kuyruk öğeleri: (kare, okuyucunun bu kareden sonra atladığı kare
+        # sayısı); kaynak sonu → (None, 0)
+        self._queue: "queue.Queue[Tuple[Optional[np.ndarray], int]]" = queue.Queue(
+            maxsize=queue_size
+        )
+        # Okuyucu thread'in her kareden sonra atlayacağı kare sayısı
+        # (set_frame_stride ile; 0 → atlama yok)
+        self._skip = 0
+        # Son döndürülen kareden sonra okuyucunun atladığı kare sayısı
+        self._last_skipped = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        # Okuyucu thread'de oluşan hata — read_frame() içinde yeniden fırlatılır
+        self._error: Optional[BaseException] = None
+        # Kaynak sonu (None) tüketildi mi?
+        self._exhausted = False
+
+    def set_frame_stride(self, stride: int) -> None:
+        """
+        Okuyucu thread'in kare atlama adımını ayarlar (open() öncesinde).
+
+        Args:
+            stride: Her N. kare okunur; aradaki N - 1 kare okuyucu thread'de
+                çözülmeden atlanır. 1 → atlama yok.
+
+        Raises:
+            ValueError: stride 1'den küçükse.
+            RuntimeError: Okuyucu thread zaten çalışıyorsa.
+        """
+        if stride < 1:
+            raise ValueError(f"stride en az 1 olmalı, verilen: {stride}")
+        if self._thread is not None:
+            raise RuntimeError("set_frame_stride() open() öncesinde çağrılmalı")
+        self._skip = stride - 1
+
+    def open(self) -> None:
+        """Sarılan kaynağı açar ve okuyucu thread'i başlatır."""
+        self._source.open()
+        self._stop.clear()
+        self._exhausted = False
+        self._last_skipped = 0
+        self._thread = threading.Thread(
+            target=self._reader, name="frame-reader", daemon=True
+        )
+        self._thread.start()
+        logger.info(
+            "Arka plan kare okuma başlatıldı | kuyruk: %d | eski kare düşürme: %s",
+            self._queue.maxsize,
+            self._drop_stale,
+        )
+
+    def _reader(self) -> None:
+        """
+        Okuyucu thread döngüsü — kareleri okuyup kuyruğa koyar.
+        Kaynak bittiğinde (veya hata olduğunda) kuyruğa None konur.
+        """
+        try:
+            put = self._put_latest if self._drop_stale else self._put
+            skip = self._skip
+            while not self._stop.is_set():
+                frame = self._source.read_frame()
+                # Kare atlama — atlanan kareler çözülmez, kuyruğa girmez
+                skipped = (
+                    self._source.skip_frames(skip)
+                    if skip and frame is not None else 0
+                )
+                if not put((frame, skipped)) or frame is None:
+                    return
+        except BaseException as exc:  # Hata tüketici thread'e taşınır
+            self._error = exc
+            self._put((None, 0))
+
+    def _put(self, item: Tuple[Optional[np.ndarray], int]) -> bool:
+        """Öğeyi kuyruğa koyar; durdurma istenirse False döndürür."""
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _put_latest(self, item: Tuple[Optional[np.ndarray], int]) -> bool:
+        """Öğeyi kuyruğa koyar; kuyruk doluysa en eski kareyi atar."""
+        while not self._stop.is_set():
+            try:
+                self._queue.put_nowait(item)
+                return True
+            except queue.Full:
+                # En eski kareyi at — tüketici bu arada almış olabilir
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    pass
+        return False
+
+    def read_frame(self) -> Optional[np.ndarray]:
+        """
+        Önceden okunmuş bir sonraki kareyi döndürür.
+
+        Returns:
+            BGR numpy array veya kaynak bittiyse None.
+
+        Raises:
+            Okuyucu thread'de oluşan hata (ör. IOError) aynen yeniden fırlatılır.
+        """
+        if self._thread is None or self._exhausted:
+            return None
+
+        frame, self._last_skipped = self._queue.get()
+        if frame is None:
+            self._exhausted = True
+            if self._error is not None:
+                raise self._error
+        return frame
+
+    def skip_frames(self, count: int) -> int:
+        """
+        Sonraki `count` kareyi atlar.
+
+        set_frame_stride() ile okuyucu thread atlamayı zaten yapıyorsa
+        (count == stride - 1) kare okunmaz; okuyucunun son kareden sonra
+        atladığı sayı döndürülür. Aksi halde kareler kuyruktan okunup atılır.
+
+        Args:
+            count: Atlanacak kare sayısı.
+
+        Returns:
+            Gerçekten atlanan kare sayısı (kaynak biterse count'tan az).
+        """
+        if self._skip and count == self._skip:
+            return self._last_skipped
+        return super().skip_frames(count)
+
+    def release(self) -> None:
+        """Okuyucu thread'i durdurur, kuyruğu boşaltır ve kaynağı kapatır."""
+        if self._thread is not None:
+            self._stop.set()
+            # Kuyruğu boşalt — put() içinde bekleyen okuyucu serbest kalır
+            while True:
+                try:
+                    self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            self._thread.join()
+            self._thread = None
+        self._source.release()
+
+    def is_opened(self) -> bool:
+        """Sarılan kaynağın açık olup olmadığını döndürür."""
+        return self._source.is_opened()
+
+    @property
+    def fps(self) -> float:
+        """Sarılan kaynağın FPS değerini döndürür."""
+        return self._source.fps
+
+    @property
+    def frame_size(self) -> tuple[int, int]:
+        """Sarılan kaynağın (genişlik, yükseklik) çözünürlüğünü döndürür."""
+        return self._source.frame_size
+
+    def __getattr__(self, name: str):
+        """Tanımlı olmayan öznitelikleri sarılan kaynağa yönlendirir."""
+        # __init__ tamamlanmadan (ör. kopyalama sırasında) özyinelemeyi önle
+        if name == "_source":
+            raise AttributeError(name)
+        return getattr(self._source, name)
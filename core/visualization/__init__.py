@@ -1,3 +1,4 @@
 from core.visualization.visualizer import Visualizer
+from core.visualization.threaded_writer import ThreadedVideoWriter
 
-__all__ = ["Visualizer"]
+__all__ = ["Visualizer", "ThreadedVideoWriter"]
@@ -0,0 +1,87 @@
+"""
+Arka Plan Thread'inde Yazan Video Yazıcı
+==========================================
+cv2.VideoWriter'ı sarar ve kare kodlamayı (encode) ayrı bir thread'de
+yapar. Ana döngü kareyi kuyruğa bırakıp hemen bir sonraki kareye geçer.
+
+Neden?
+    - VideoWriter.write() codec kodlaması yapar ve kare başına birkaç
+      milisaniye sürebilir; ana döngüde sıralı çalışırsa FPS düşer
+    - write() C++ tarafında GIL'i bıraktığı için kodlama, sonraki karenin
+      ön-işleme/tespit adımlarıyla gerçekten eş zamanlı ilerler
+    - Sınırlı (bounded) kuyruk geri basınç (back-pressure) sağlar; kodlama
+      yavaşsa ana döngü bekler, bellek kullanımı sabit kalır
+
+ThreadedVideoSource (okuma) ile birlikte kullanıldığında
+okuma → işleme → yazma üç aşamalı bir boru hattı oluşur.
+
+NOT: Kuyruğa verilen kare, yazılana kadar değiştirilmemelidir. Visualizer
+her kare için yeni bir dizi çizer (veya kaynağın döndürdüğü yeni kareye
+çizer) — tampon yeniden kullanılmaz.
+"""
+
+import queue
+import threading
+from typing import Optional
+
+import cv2
+import numpy as np
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ThreadedVideoWriter:
+    """
+    cv2.VideoWriter için arka plan thread'li sarmalayıcı.
+
+    write() / release() arayüzü cv2.VideoWriter ile aynıdır —
+    Visualizer yazıcının türünü bilmeden kullanır.
+    """
+
+    def __init__(self, writer: cv2.VideoWriter, queue_size: int = 4) -> None:
+        """
+        Args:
+            writer: Açılmış cv2.VideoWriter nesnesi.
+            queue_size: Kodlanmayı bekleyebilecek en fazla kare sayısı.
+        """
+        self._writer = writer
+        self._queue: "queue.Queue[Optional[np.ndarray]]" = queue.Queue(
+            maxsize=queue_size
+        )
+        self._thread = threading.Thread(
+            target=self._run, name="frame-writer", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        """
+        Yazıcı thread döngüsü — None (kapanış işareti) gelene kadar yazar.
+
+        Yazma hatası loglanır ve sonraki kareler atılır; kuyruk boşaltılmaya
+        devam edilir ki ana döngü dolu kuyrukta sonsuza dek beklemesin.
+        """
+        failed = False
+        while True:
+            frame = self._queue.get()
+            if frame is None:
+                return
+            if failed:
+                continue
+            try:
+                self._writer.write(frame)
+            except cv2.error as exc:
+                logger.error("Video yazma hatası, kalan kareler atlanıyor: %s", exc)
+                failed = True
+
+    def write(self, frame: np.ndarray) -> None:
+        """Kareyi yazma kuyruğuna ekler (kuyruk doluysa bekler)."""
+        self._queue.put(frame)
+
+    def release(self) -> None:
+        """Kuyruktaki tüm kareleri yazar, thread'i durdurur ve dosyayı kapatır."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._writer.release()
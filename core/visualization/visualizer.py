@@ -15,13 +15,15 @@ Bu renk sistemi sayesinde kullanıcı hangi tespitlerin güvenilir,
 hangilerinin şüpheli olduğunu bir bakışta anlayabilir.
 """
 
-from typing import List, Optional
+import os
+from typing import Dict, List, Optional, Tuple
 
 import cv2
 import numpy as np
 
 from config.settings import VisualizationConfig, DetectionConfig
-from core.detection.base_detector import Detection
+from core.detection.base_detector import Detection, DetectionBatch
+from core.visualization.threaded_writer import ThreadedVideoWriter
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -35,6 +37,34 @@ _COLOR_LOW = (0, 180, 255)         # Turuncu — düşük güvenli tespit kutu r
 _COLOR_TEXT_BG_HIGH = (0, 180, 0)  # Koyu yeşil — yüksek güven etiket arka planı
 _COLOR_TEXT_BG_LOW = (0, 140, 200) # Koyu turuncu — düşük güven etiket arka planı
 
+# (kutu_rengi, etiket_arka_plan_rengi) çiftleri:
+#   güven ≥ high_confidence_threshold → YEŞİL (güvenilir tespit)
+#   güven < high_confidence_threshold → TURUNCU (şüpheli tespit)
+_COLORS_HIGH = (_COLOR_HIGH, _COLOR_TEXT_BG_HIGH)
+_COLORS_LOW = (_COLOR_LOW, _COLOR_TEXT_BG_LOW)
+
+# =============================================================================
+# ÇIKTI VİDEO CODEC SIRASI
+# =============================================================================
+# Uzantıya göre denenecek FOURCC'ler (ilk açılabilen kullanılır).
+# H.264 (avc1/H264) FFmpeg derlemesinde libx264/openh264 veya donanım
+# kodlayıcı (NVENC/QSV/VideoToolbox) varsa kullanılır — XVID'den hızlı
+# ve çıktı çok daha küçüktür; yoksa mp4v'ye düşülür.
+_CODECS_BY_EXTENSION = {
+    ".mp4": ("avc1", "H264", "mp4v"),
+    ".avi": ("XVID", "MJPG"),
+}
+_DEFAULT_CODECS = ("XVID",)
+
+# Yazıcı arka uçları (sırayla denenir). FFmpeg açıkça istenir — H.264 ve
+# donanım kodlayıcılar bu arka uç üzerinden kullanılabilir. FFmpeg'siz
+# derlemelerde (yalnızca GStreamer/MSMF) CAP_ANY ile varsayılan arka uca
+# düşülür.
+_WRITER_BACKENDS = (
+    (cv2.CAP_FFMPEG, "FFMPEG"),
+    (cv2.CAP_ANY, "ANY"),
+)
+
 
 class Visualizer:
     """
@@ -50,6 +80,11 @@ class Visualizer:
     # OpenCV yazı tipi — tüm metin çizimlerinde kullanılır
     _FONT = cv2.FONT_HERSHEY_SIMPLEX
 
+    # Bilgi paneli boyutu (piksel) — dolu dikdörtgen (0,0)-(W,H) köşeleri
+    # dahil çizildiği için kaplanan alan (H+1) x (W+1)'dir
+    _PANEL_WIDTH = 200
+    _PANEL_HEIGHT = 60
+
     def __init__(
         self,
         config: VisualizationConfig,
@@ -72,8 +107,33 @@ class Visualizer:
             self._high_conf = detection_config.high_confidence_threshold
 
         # Video yazıcı — save_output etkinse setup_writer() ile başlatılır
+        # (threaded_writer=True ise ThreadedVideoWriter; arayüz aynıdır)
         self._writer: Optional[cv2.VideoWriter] = None
 
+        # Panel arka planı — düz renkli yama bir kez oluşturulur; her karede
+        # yalnızca panel bölgesi (ROI) ile harmanlanır (bkz. _draw_info_panel)
+        self._panel_overlay = np.empty(
+            (self._PANEL_HEIGHT + 1, self._PANEL_WIDTH + 1, 3), dtype=np.uint8
+        )
+        self._panel_overlay[:] = config.info_panel_color
+
+        # Etiket metni → getTextSize sonucu önbelleği. Güven 2 ondalıkla
+        # yazıldığı için farklı etiket sayısı azdır (~yüzlerce); font ve
+        # ölçek sabit olduğundan boyut her etiket için bir kez hesaplanır.
+        self._label_sizes: Dict[str, Tuple[int, int]] = {}
+
+        # Kutu başına okunan config alanları — config frozen olduğu için
+        # bir kez yerel özniteliğe alınır (self._config.x zinciri yerine)
+        self._box_thickness = config.box_thickness
+        self._font_scale = config.font_scale
+        self._show_confidence = config.show_confidence
+
+        # Panel harmanlama ağırlıkları ve yazı rengi — kare başına
+        # 1 - alpha çıkarması ve config erişimi yapılmaz
+        self._panel_alpha = config.info_panel_alpha
+        self._panel_beta = 1 - config.info_panel_alpha
+        self._font_color = config.font_color
+
         logger.info("Visualizer başlatıldı | Çıktı kaydetme: %s", config.save_output)
 
     def draw(
@@ -81,12 +141,13 @@ class Visualizer:
         frame: np.ndarray,
         detections: List[Detection],
         fps: float = 0.0,
+        inplace: bool = False,
     ) -> np.ndarray:
         """
         Frame üzerine tüm tespit sonuçlarını çizer.
 
         İşlem sırası:
-            1. Frame'in kopyasını al (orijinal korunur)
+            1. Frame'in kopyasını al (orijinal korunur; inplace=True ise atlanır)
             2. Her tespit için bounding box + etiket çiz
             3. Bilgi paneli çiz (FPS, tespit sayısı)
             4. Video yazıcıya yaz (etkinse)
@@ -95,17 +156,27 @@ class Visualizer:
             frame: Orijinal BGR frame (değiştirilmez).
             detections: Post-processing sonrası tespit listesi.
             fps: Mevcut işlem FPS değeri (bilgi paneli için).
+            inplace: True ise doğrudan frame üzerine çizilir — kare başına
+                tam boy kopya yapılmaz. Çizimsiz orijinal kareye sonradan
+                ihtiyaç yoksa kullanılmalıdır.
 
         Returns:
-            Çizim yapılmış frame kopyası (orijinal bozulmaz).
+            Çizim yapılmış frame (inplace=False ise kopya; orijinal bozulmaz).
         """
-        # Frame'in kopyası üzerinde çalış — orijinali koru
+        # Varsayılan: kopya üzerinde çalış — orijinali koru
         # (örnekleme modülü orijinali kaydetmek isteyebilir)
-        output = frame.copy()
-
-        # Her tespit için bounding box ve güven etiketi çiz
-        for detection in detections:
-            self._draw_bounding_box(output, detection)
+        output = frame if inplace else frame.copy()
+
+        # Her tespit için bounding box ve güven etiketi çiz.
+        # DetectionBatch satırları doğrudan dizilerden okunur — kutu başına
+        # Detection nesnesi üretilmez (.tolist() native int/float verir)
+        if isinstance(detections, DetectionBatch):
+            rows = zip(detections.boxes.tolist(), detections.confidences.tolist())
+        else:
+            rows = (((d.x, d.y, d.w, d.h), d.confidence) for d in detections)
+        draw_box = self._draw_bounding_box
+        for box, confidence in rows:
+            draw_box(output, box, confidence)
 
         # Sol üst köşeye FPS + tespit sayısı paneli çiz
         if self._config.show_info_panel:
@@ -117,25 +188,9 @@ class Visualizer:
 
         return output
 
-    def _get_box_color(self, confidence: float) -> tuple:
-        """
-        Güven seviyesine göre kutu ve etiket arka plan rengini belirler.
-
-        Renk kodlaması mantığı:
-            güven ≥ high_confidence_threshold → YEŞİL (güvenilir tespit)
-            güven < high_confidence_threshold → TURUNCU (şüpheli tespit)
-
-        Args:
-            confidence: Tespite ait güven skoru.
-
-        Returns:
-            (kutu_rengi, etiket_arka_plan_rengi) tuple'ı.
-        """
-        if confidence >= self._high_conf:
-            return _COLOR_HIGH, _COLOR_TEXT_BG_HIGH
-        return _COLOR_LOW, _COLOR_TEXT_BG_LOW
-
-    def _draw_bounding_box(self, frame: np.ndarray, det: Detection) -> None:
+    def _draw_bounding_box(
+        self, frame: np.ndarray, box: List[int], confidence: float
+    ) -> None:
         """
         Tek bir tespit kutusunu güven rengine göre çizer.
 
@@ -146,14 +201,19 @@ class Visualizer:
 
         Args:
             frame: Üzerine çizim yapılacak frame (in-place değiştirilir).
-            det: Çizilecek tespit nesnesi.
+            box: Kutu koordinatları [x, y, w, h] (piksel).
+            confidence: Tespitin güven skoru.
         """
+        x, y, w, h = box
+
         # Kutunun köşe koordinatlarını hesapla
-        top_left = (det.x, det.y)
-        bottom_right = (det.x + det.w, det.y + det.h)
+        top_left = (x, y)
+        bottom_right = (x + w, y + h)
 
-        # Güven seviyesine göre renk belirle
-        box_color, text_bg_color = self._get_box_color(det.confidence)
+        # Güven seviyesine göre renk belirle (modül sabiti çiftlerden)
+        box_color, text_bg_color = (
+            _COLORS_HIGH if confidence >= self._high_conf else _COLORS_LOW
+        )
 
         # --- Bounding Box Çizimi ---
         cv2.rectangle(
@@ -161,25 +221,28 @@ class Visualizer:
             top_left,
             bottom_right,
             box_color,                       # Güven tabanlı renk
-            self._config.box_thickness,      # Çizgi kalınlığı (piksel)
+            self._box_thickness,             # Çizgi kalınlığı (piksel)
         )
 
         # --- Güven Skoru Etiketi ---
-        if self._config.show_confidence:
+        if self._show_confidence:
             # Etiket metni: "Yaya 1.44"
-            label = f"Yaya {det.confidence:.2f}"
+            label = f"Yaya {confidence:.2f}"
 
-            # Metin boyutunu hesapla (etiket arka planı için gerekli)
-            label_size, _ = cv2.getTextSize(
-                label, self._FONT, self._config.font_scale, 1
-            )
+            # Metin boyutu (etiket arka planı için gerekli) — önbellekten
+            label_size = self._label_sizes.get(label)
+            if label_size is None:
+                label_size, _ = cv2.getTextSize(
+                    label, self._FONT, self._font_scale, 1
+                )
+                self._label_sizes[label] = label_size
 
             # Etiket arka planı — metin okunabilirliğini artırır
             # Kutunun hemen üstüne yarı saydam dikdörtgen çizer
             cv2.rectangle(
                 frame,
-                (det.x, det.y - label_size[1] - 8),   # Sol üst (metin üstü)
-                (det.x + label_size[0] + 4, det.y),     # Sağ alt (kutu üstü)
+                (x, y - label_size[1] - 8),           # Sol üst (metin üstü)
+                (x + label_size[0] + 4, y),             # Sağ alt (kutu üstü)
                 text_bg_color,                            # Güven tabanlı arka plan rengi
                 cv2.FILLED,                               # İçi dolu dikdörtgen
             )
@@ -188,9 +251,9 @@ class Visualizer:
             cv2.putText(
                 frame,
                 label,
-                (det.x + 2, det.y - 4),       # Metin konumu (sol alt referans)
+                (x + 2, y - 4),               # Metin konumu (sol alt referans)
                 self._FONT,
-                self._config.font_scale,
+                self._font_scale,
                 (255, 255, 255),               # Beyaz yazı rengi
                 1,                              # Yazı kalınlığı
                 cv2.LINE_AA,                    # Anti-aliasing (pürüzsüz kenarlar)
@@ -207,40 +270,34 @@ class Visualizer:
             Satır 2: "Tespit: 4" — Mevcut karedeki toplam tespit sayısı
 
         Yarı saydamlık tekniği:
-            1. Frame kopyası oluştur
-            2. Kopya üzerine opak dikdörtgen çiz
-            3. Orijinal ile kopyayı alpha-blending ile birleştir
+            1. Panel renginde düz yama (constructor'da bir kez oluşturulur)
+            2. Yama ile frame'in panel bölgesi (ROI) alpha-blending ile birleşir
             Bu yöntem altındaki görüntünün görünmesini sağlar.
 
+        Performans notu:
+            Tam frame kopyası üzerine dikdörtgen çizip tüm kareyi
+            harmanlamak yerine yalnızca ~200x60 piksellik ROI harmanlanır.
+            Panel dışındaki pikseller her iki yöntemde de değişmez —
+            sonuç birebir aynıdır.
+
         Args:
             frame: Üzerine çizim yapılacak frame.
             count: Tespit sayısı.
             fps: Anlık FPS değeri.
         """
-        panel_height = 60   # Panel yüksekliği (piksel)
-        panel_width = 200    # Panel genişliği (piksel)
-
-        # Alpha blending için frame kopyası oluştur
-        overlay = frame.copy()
-
-        # Kopya üzerine siyah/opak dikdörtgen çiz
-        cv2.rectangle(
-            overlay,
-            (0, 0),                              # Sol üst köşe
-            (panel_width, panel_height),          # Sağ alt köşe
-            self._config.info_panel_color,        # Panel arka plan rengi
-            cv2.FILLED,                           # İçi dolu
-        )
+        # Panel bölgesi (ROI) — küçük karelerde kare sınırına kırpılır
+        roi = frame[: self._PANEL_HEIGHT + 1, : self._PANEL_WIDTH + 1]
+        overlay = self._panel_overlay[: roi.shape[0], : roi.shape[1]]
 
-        # Alpha blending: overlay * alpha + frame * (1 - alpha)
-        # Bu işlem yarı saydam efekt yaratır
+        # Alpha blending: overlay * alpha + roi * (1 - alpha)
+        # Bu işlem yarı saydam efekt yaratır; sonuç doğrudan ROI'ye yazılır
         cv2.addWeighted(
             overlay,
-            self._config.info_panel_alpha,        # Panel saydamlığı (0.6)
-            frame,
-            1 - self._config.info_panel_alpha,    # Arka plan ağırlığı (0.4)
+            self._panel_alpha,                     # Panel saydamlığı (0.6)
+            roi,
+            self._panel_beta,                      # Arka plan ağırlığı (0.4)
             0,                                     # Ek parlaklık (gamma)
-            frame,                                 # Sonuç → orijinal frame'e yaz
+            roi,                                   # Sonuç → frame'in panel bölgesine
         )
 
         # --- FPS Metni ---
@@ -250,7 +307,7 @@ class Visualizer:
             (10, 22),                     # Metin konumu
             self._FONT,
             0.55,                         # Yazı boyutu
-            self._config.font_color,      # Yazı rengi (yeşil)
+            self._font_color,             # Yazı rengi (yeşil)
             1,                            # Yazı kalınlığı
             cv2.LINE_AA,
         )
@@ -262,7 +319,7 @@ class Visualizer:
             (10, 48),                     # İkinci satır konumu
             self._FONT,
             0.55,
-            self._config.font_color,
+            self._font_color,
             1,
             cv2.LINE_AA,
         )
@@ -273,18 +330,68 @@ class Visualizer:
         """
         Video yazıcıyı (VideoWriter) başlatır.
 
-        XVID codec'i ile AVI formatında çıktı üretir.
+        Codec dosya uzantısına göre seçilir (bkz. _CODECS_BY_EXTENSION):
+            .avi → XVID (varsayılan), yoksa MJPG
+            .mp4 → H.264 (avc1/H264), yoksa mp4v
+        Sırayla denenir, ilk açılabilen kullanılır. Codec'ler önce FFmpeg
+        arka ucuyla, açılamazsa varsayılan arka uçla (CAP_ANY) denenir.
         draw() metodu her çağrıldığında otomatik olarak yazılır.
+        threaded_writer=True ise kodlama arka plan thread'inde yapılır.
 
         Args:
             output_path: Çıktı dosya yolu (örn: "output/result.avi").
             fps: Video FPS değeri.
             frame_size: (genişlik, yükseklik) tuple'ı.
+
+        Raises:
+            IOError: Uzantı için hiçbir arka uç/codec ile yazıcı açılamazsa.
+        """
+        extension = os.path.splitext(output_path)[1].lower()
+        codecs = _CODECS_BY_EXTENSION.get(extension, _DEFAULT_CODECS)
+
+        opened = self._open_writer(output_path, codecs, fps, frame_size)
+        if opened is None:
+            raise IOError(
+                f"Video yazıcı açılamadı: {output_path} "
+                f"(denenen codec'ler: {', '.join(codecs)})"
+            )
+        writer, codec, backend = opened
+
+        self._writer = writer
+        if self._config.threaded_writer:
+            self._writer = ThreadedVideoWriter(self._writer)
+        logger.info(
+            "Video yazıcı başlatıldı: %s | codec: %s | arka uç: %s | "
+            "arka plan yazma: %s",
+            output_path,
+            codec,
+            backend,
+            self._config.threaded_writer,
+        )
+
+    @staticmethod
+    def _open_writer(
+        output_path: str,
+        codecs: Tuple[str, ...],
+        fps: float,
+        frame_size: tuple[int, int],
+    ) -> Optional[Tuple[cv2.VideoWriter, str, str]]:
+        """
+        Arka uç ve codec kombinasyonlarını sırayla dener.
+
+        Returns:
+            (yazıcı, codec, arka uç adı) veya hiçbiri açılamazsa None.
         """
-        # XVID codec — AVI container ile uyumlu, yaygın desteklenen codec
-        fourcc = cv2.VideoWriter_fourcc(*"XVID")
-        self._writer = cv2.VideoWriter(output_path, fourcc, fps, frame_size)
-        logger.info("Video yazıcı başlatıldı: %s", output_path)
+        for backend, backend_name in _WRITER_BACKENDS:
+            for codec in codecs:
+                writer = cv2.VideoWriter(
+                    output_path, backend,
+                    cv2.VideoWriter_fourcc(*codec), fps, frame_size,
+                )
+                if writer.isOpened():
+                    return writer, codec, backend_name
+                writer.release()
+        return None
 
     def release_writer(self) -> None:
         """
@@ -26,11 +26,12 @@ Akış Şeması:
 import argparse
 import sys
 
-# Proje iç modülleri
-from config.settings import PipelineConfig           # Merkezi ayarlar
-from core.source.source_factory import SourceFactory, SourceType  # Video kaynağı üretici
-from pipeline.detection_pipeline import DetectionPipeline          # Ana pipeline
-from utils.logger import get_logger                                # Loglama yardımcısı
+# Proje iç modülleri — modül düzeyinde yalnızca hafif olanlar.
+# OpenCV/NumPy çeken modüller (kaynak fabrikası, pipeline) main() içinde,
+# argümanlar ayrıştırıldıktan sonra yüklenir; --help ve hatalı argüman
+# durumunda OpenCV hiç yüklenmez.
+from config.settings import PipelineConfig           # Merkezi ayarlar (saf dataclass)
+from utils.logger import get_logger                  # Loglama yardımcısı
 
 # Bu modülün logger'ı — loglar "main" etiketiyle yazılır
 logger = get_logger(__name__)
@@ -44,8 +45,17 @@ def parse_arguments() -> argparse.Namespace:
         --source       : Video kaynağı ('file' veya 'camera')
         --input        : Video dosya yolu (file modu için zorunlu)
         --camera-index : Kamera cihaz indeksi (varsayılan: 0)
+        --camera-mjpg  : Kamerayı MJPG + hedef genişlikte açma bayrağı
+        --low-latency  : Kamera tamponunu 1 kareye indirme bayrağı
+        --threaded-read: Kareleri arka plan thread'inde önceden okuma bayrağı
+        --threaded-preprocess: Okuma + ön-işlemeyi arka plan thread'inde yapma bayrağı
         --target-width : Ön-işleme hedef genişlik piksel (varsayılan: 640)
+        --frame-stride : Kaç karede bir tespit yapılacağı (varsayılan: 1)
+        --gray         : Ön-işlemeyi ve HOG'u tek kanal (gri) görüntüde yapma bayrağı
+        --detect-batch : Birlikte tespit edilecek kare sayısı (varsayılan: 1)
         --save-output  : Çıktı videosunu kaydetme bayrağı
+        --threaded-write: Çıktıyı arka plan thread'inde kodlama bayrağı
+        --no-display   : Sonuç penceresini göstermeme (başsız çalışma) bayrağı
         --output-path  : Çıktı video dosya yolu
 
     Returns:
@@ -59,6 +69,7 @@ def parse_arguments() -> argparse.Namespace:
   python main.py --source file --input input/video.mp4
   python main.py --source camera --camera-index 0
   python main.py --source file --input input/video.mp4 --save-output
+  python main.py --source file --input input/video.mp4 --save-output --threaded-read --threaded-write
         """,
     )
 
@@ -83,6 +94,27 @@ def parse_arguments() -> argparse.Namespace:
         help="Kamera indeksi (varsayılan: 0)",
     )
 
+    parser.add_argument(
+        "--camera-mjpg",
+        action="store_true",
+        help="Kameradan MJPG formatında ve --target-width genişliğinde yakala",
+    )
+    parser.add_argument(
+        "--low-latency",
+        action="store_true",
+        help="Kamerada yalnızca en taze kareyi işle (--threaded-read ile eski kareler atılır)",
+    )
+    parser.add_argument(
+        "--threaded-read",
+        action="store_true",
+        help="Kareleri arka plan thread'inde önceden oku (decode ile işleme örtüşür)",
+    )
+    parser.add_argument(
+        "--threaded-preprocess",
+        action="store_true",
+        help="Okuma + ön-işlemeyi arka plan thread'inde yap (ön-işleme tespitle örtüşür)",
+    )
+
     # --- İşleme Ayarları ---
     parser.add_argument(
         "--target-width",
@@ -90,6 +122,23 @@ def parse_arguments() -> argparse.Namespace:
         default=640,
         help="Ön-işleme hedef genişlik (varsayılan: 640)",
     )
+    parser.add_argument(
+        "--frame-stride",
+        type=int,
+        default=1,
+        help="Her N. kareyi işle, aradakileri çözmeden atla (varsayılan: 1)",
+    )
+    parser.add_argument(
+        "--gray",
+        action="store_true",
+        help="Ön-işleme ve tespiti gri tonlamalı görüntüde yap (daha hızlı, sonuçlar biraz farklı)",
+    )
+    parser.add_argument(
+        "--detect-batch",
+        type=int,
+        default=1,
+        help="K kareyi birlikte, paralel tespit et (çok çekirdekte verim artar; varsayılan: 1)",
+    )
 
     # --- Çıktı Ayarları ---
     parser.add_argument(
@@ -97,12 +146,22 @@ def parse_arguments() -> argparse.Namespace:
         action="store_true",
         help="Çıktı videosunu kaydet",
     )
+    parser.add_argument(
+        "--threaded-write",
+        action="store_true",
+        help="Çıktı karelerini arka plan thread'inde kodla (--save-output ile)",
+    )
     parser.add_argument(
         "--output-path",
         type=str,
         default="output/result.avi",
         help="Çıktı video dosya yolu (varsayılan: output/result.avi)",
     )
+    parser.add_argument(
+        "--no-display",
+        action="store_true",
+        help="Sonuç penceresini gösterme (başsız çalışma; Ctrl+C ile durdurulur, rapor yine yazılır)",
+    )
 
     return parser.parse_args()
 
@@ -130,11 +189,19 @@ def build_config(args: argparse.Namespace) -> PipelineConfig:
     # yalnızca komut satırından gelen değerler burada override edilir
     config = PipelineConfig(
         detection=DetectionConfig(),
-        preprocess=PreprocessConfig(target_width=args.target_width),
+        preprocess=PreprocessConfig(
+            target_width=args.target_width,
+            convert_to_gray=args.gray,
+        ),
         visualization=VisualizationConfig(
             save_output=args.save_output,
             output_path=args.output_path,
+            threaded_writer=args.threaded_write,
         ),
+        show_display=not args.no_display,
+        threaded_preprocess=args.threaded_preprocess,
+        frame_stride=args.frame_stride,
+        detect_batch_size=args.detect_batch,
     )
 
     return config
@@ -154,6 +221,10 @@ def main() -> None:
     """
     args = parse_arguments()
 
+    # Ağır modüller — argüman ayrıştırma başarılı olduktan sonra yüklenir
+    from core.source.source_factory import SourceFactory, SourceType  # Video kaynağı üretici
+    from pipeline.detection_pipeline import DetectionPipeline          # Ana pipeline
+
     # Başlatma banner'ı — logları ayırt etmek için görsel çizgi
     logger.info("=" * 50)
     logger.info("Yaya Tespit Sistemi Başlatılıyor")
@@ -169,6 +240,13 @@ def main() -> None:
     else:
         source_type = SourceType.CAMERA
 
+    if args.frame_stride < 1:
+        logger.error("--frame-stride en az 1 olmalı (verilen: %d).", args.frame_stride)
+        sys.exit(1)
+    if args.detect_batch < 1:
+        logger.error("--detect-batch en az 1 olmalı (verilen: %d).", args.detect_batch)
+        sys.exit(1)
+
     # --- Video Kaynağı Oluşturma ---
     # SourceFactory (Factory Pattern) uygun kaynak nesnesini üretir
     try:
@@ -176,6 +254,12 @@ def main() -> None:
             source_type=source_type,
             path=args.input,
             camera_index=args.camera_index,
+            threaded=args.threaded_read,
+            # Yakalama çözünürlüğü ön-işleme genişliğine yakın istenir —
+            # büyük kareyi çözüp sonra küçültmek gerekmez
+            camera_width=args.target_width if args.camera_mjpg else 0,
+            camera_fourcc="MJPG" if args.camera_mjpg else None,
+            low_latency=args.low_latency,
         )
     except (FileNotFoundError, ValueError) as e:
         logger.error("Kaynak oluşturma hatası: %s", e)
@@ -23,19 +23,28 @@ Tasarım Prensipleri:
     - Context Manager: Video kaynağı 'with' bloğu ile güvenli kapatılır
 """
 
+import contextlib
+import itertools
 import os
+import queue
+import threading
 from dataclasses import asdict
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
 
 import cv2
 
 # Konfigürasyon
-from config.settings import PipelineConfig
+from config.settings import PipelineConfig, default_pipeline_config
 
 # Kaynak
 from core.source.base_source import VideoSource
+from core.source.threaded_source import ThreadedVideoSource
 
 # İşleme bileşenleri (pipeline sırasına göre)
 from core.preprocessing.preprocessor import Preprocessor
+from core.detection.base_detector import DetectionBatch
 from core.detection.hog_detector import HOGDetector
 from core.postprocessing.postprocessor import Postprocessor
 from core.visualization.visualizer import Visualizer
@@ -48,6 +57,13 @@ from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Ön-işleme adımının çıktısı:
+# (kaynak kare numarası, orijinal kare, ön-işlenmiş kare, ölçek faktörü)
+PreparedFrame = Tuple[int, np.ndarray, np.ndarray, float]
+
+# threaded_preprocess modunda önceden hazırlanabilecek en fazla kare sayısı
+_PREPARED_QUEUE_SIZE = 2
+
 
 class DetectionPipeline:
     """
@@ -66,17 +82,39 @@ class DetectionPipeline:
         - FPSCounter: İşlem hızı ölçümü
     """
 
-    def __init__(self, source: VideoSource, config: PipelineConfig) -> None:
+    def __init__(
+        self, source: VideoSource, config: Optional[PipelineConfig] = None
+    ) -> None:
         """
         Pipeline'ı tüm bileşenleriyle başlatır.
 
         Args:
             source: Video kaynağı (dosya veya kamera).
             config: Pipeline konfigürasyonu (tüm alt ayarları içerir).
+                None ise paylaşılan varsayılan config kullanılır
+                (bkz. default_pipeline_config).
         """
+        if config is None:
+            config = default_pipeline_config()
+        if config.frame_stride < 1:
+            raise ValueError(
+                f"frame_stride en az 1 olmalı, verilen: {config.frame_stride}"
+            )
+        if config.detect_batch_size < 1:
+            raise ValueError(
+                "detect_batch_size en az 1 olmalı, "
+                f"verilen: {config.detect_batch_size}"
+            )
+
         self._source = source
         self._config = config
 
+        # Arka plan okumada kare atlama okuyucu thread'e verilir — atlanan
+        # kareler orada grab() ile çözülmeden geçilir; aksi halde okuyucu
+        # her kareyi çözüp kuyruğa koyar, pipeline da onları okuyup atardı
+        if config.frame_stride > 1 and isinstance(source, ThreadedVideoSource):
+            source.set_frame_stride(config.frame_stride)
+
         # --- Ana İşleme Bileşenleri ---
         # Her bileşen kendi config sınıfını alır (Dependency Injection)
         self._preprocessor = Preprocessor(config.preprocess)
@@ -103,8 +141,29 @@ class DetectionPipeline:
                 sample_interval=config.reporting.sample_interval,
                 min_confidence_to_save=config.reporting.high_confidence_threshold,
                 save_raw=config.reporting.save_raw_frames,
+                threaded=config.reporting.threaded_sampling,
             )
 
+        # Çizimsiz orijinal kare yalnızca ham kare örneklemesinde gerekir;
+        # aksi halde Visualizer kareyi kopyalamadan üzerine çizer
+        self._draw_inplace = not (
+            self._sampler is not None and config.reporting.save_raw_frames
+        )
+
+        # Çizilmiş kareyi kullanan biri yoksa (pencere, çıktı videosu,
+        # örnekleme) çizim adımı tamamen atlanır — başsız çalışmada
+        # kare başına çizim maliyeti ödenmez
+        self._draw_output = (
+            config.show_display
+            or config.visualization.save_output
+            or self._sampler is not None
+        )
+
+        # Pencere adı ve çıkış tuşu kodu — her karede config okuması ve
+        # ord() çağrısı yapılmaz
+        self._window_name = config.display_window_name
+        self._quit_code = ord(config.quit_key)
+
     def run(self) -> None:
         """
         Pipeline'ı çalıştırır.
@@ -115,13 +174,14 @@ class DetectionPipeline:
             3. Video kaynağını aç (context manager)
             4. Çıktı yazıcıyı hazırla (etkinse)
             5. Kare kare işleme döngüsü
-            6. Yazıcıyı kapat
+            6. Yazıcıyı kapat ve dedektörü serbest bırak (hata durumunda da)
             7. Rapor oluştur
 
         Durma koşulları:
             - Video sonu (read_frame() → None)
             - 'q' tuşuna basılması
-            - Ctrl+C (KeyboardInterrupt — main.py'de yakalanır)
+            - Ctrl+C (KeyboardInterrupt — normal durma gibi ele alınır,
+              rapor yine oluşturulur)
         """
         logger.info("Pipeline başlatılıyor...")
 
@@ -132,15 +192,26 @@ class DetectionPipeline:
         if self._reporter:
             self._reporter.start()
 
-        # Context manager ile kaynağı aç/kapat
-        # 'with' bloğu hata durumunda bile kaynağı kapatmayı garantiler
-        with self._source:
-            self._setup_output_writer()   # Video yazıcıyı hazırla
-            self._process_frames()         # Ana işleme döngüsü
-            self._visualizer.release_writer()  # Yazıcıyı kapat
+        try:
+            # Context manager ile kaynağı aç/kapat
+            # 'with' bloğu hata durumunda bile kaynağı kapatmayı garantiler
+            with self._source:
+                self._setup_output_writer()   # Video yazıcıyı hazırla
+                self._process_frames()         # Ana işleme döngüsü
+        finally:
+            # Hata veya Ctrl+C durumunda da çalışır: arka plan yazıcıdaki
+            # kareler yazılır ve dosya düzgün kapatılır (aksi halde daemon
+            # thread kareleri düşürür, .mp4 dosyası sonlandırılmaz)
+            self._visualizer.release_writer()
+            if self._sampler:
+                self._sampler.close()          # Bekleyen örnek kareleri yaz
+
+            # Dedektörün ek kaynaklarını (thread havuzu vb.) serbest bırak
+            self._detector.release()
 
-        # OpenCV pencerelerini kapat
-        cv2.destroyAllWindows()
+            # OpenCV pencerelerini kapat (başsız çalışmada pencere açılmadı)
+            if self._config.show_display:
+                cv2.destroyAllWindows()
 
         # Pipeline sonunda rapor oluştur
         self._generate_report()
@@ -160,77 +231,228 @@ class DetectionPipeline:
             6. Frame örnekleme (diske kaydetme, opsiyonel)
             7. İstatistik kaydetme (rapor için, opsiyonel)
             8. Ekrana gösterme ve çıkış kontrolü
+
+        1-2. adımlar bu döngüde, 3-8. adımlar _handle_frame() içinde yapılır.
+        detect_batch_size > 1 ise K kare birlikte okunup toplu tespit edilir,
+        ardından her kare sırayla 3-8. adımlardan geçer.
         """
         frame_count = 0  # İşlenen toplam kare sayısı
+        batch_size = self._config.detect_batch_size
+
+        # Okuma + ön-işleme adımı: sıralı ya da arka plan thread'inde
+        # (threaded_preprocess). closing() → döngü 'q' veya hata ile
+        # kesilse de ön-işleme thread'i durdurulur.
+        if self._config.threaded_preprocess:
+            frames = self._prepared_frames_threaded()
+        else:
+            frames = self._prepared_frames()
+
+        # Ctrl+C (KeyboardInterrupt) normal durma gibi ele alınır — başsız
+        # çalışmada tek çıkış yolu budur; yazıcı kapatılır ve rapor yine
+        # oluşturulur
+        try:
+            with contextlib.closing(frames):
+                while True:
+                    # === Adım 1: Kare Okuma + Ön-İşleme ===
+                    # Resize + görüntü iyileştirme → dedektör için hazırlık.
+                    # detect_batch_size > 1 ise ardışık K kare birlikte alınır.
+                    chunk = list(itertools.islice(frames, batch_size))
+                    if not chunk:
+                        # Video sonu veya kamera bağlantısı koptu
+                        logger.info("Video sonu (toplam %d kare işlendi).", frame_count)
+                        break
+
+                    # === Adım 2: Tespit ===
+                    # HOG + SVM ile yaya tespiti → ham tespitler. Toplu modda
+                    # kareler dedektörün thread havuzunda paralel işlenir
+                    # (sonuçlar girdi sırasıyla döner)
+                    if batch_size == 1:
+                        results = [self._detector.detect(chunk[0][2])]
+                    else:
+                        results = self._detector.detect_batch(
+                            [processed for _, _, processed, _ in chunk]
+                        )
+
+                    # FPS sayacını güncelle (kayan ortalama hesabı için) —
+                    # toplu modda bir kez, partideki kare sayısıyla: K kare aynı
+                    # anda tamamlanır, süre karelere eşit dağıtılır
+                    self._fps_counter.tick(len(chunk))
+
+                    # === Adım 3-8: Kare başına son-işleme, çizim, gösterim ===
+                    for (frame_number, frame, _, scale), detections in zip(
+                        chunk, results
+                    ):
+                        if not self._handle_frame(
+                            frame_number, frame, detections, scale
+                        ):
+                            logger.info("Kullanıcı tarafından durduruldu.")
+                            return
+                        frame_count += 1
+        except KeyboardInterrupt:
+            logger.info("Ctrl+C ile durduruldu (toplam %d kare işlendi).", frame_count)
+
+    def _handle_frame(
+        self,
+        frame_number: int,
+        frame: np.ndarray,
+        detections: DetectionBatch,
+        scale: float,
+    ) -> bool:
+        """
+        Tespit edilmiş tek bir kare için 3-8. adımları çalıştırır.
+
+        Args:
+            frame_number: Kaynak videodaki kare numarası (1'den başlar).
+            frame: Orijinal (ön-işlenmemiş) kare.
+            detections: Ön-işlenmiş karedeki ham tespitler.
+            scale: Ön-işleme ölçek faktörü (koordinatları geri ölçeklemek için).
+
+        Returns:
+            Kullanıcı çıkış tuşuna bastıysa False, aksi halde True.
+        """
+        # === Adım 3: Koordinat Ölçekleme ===
+        # Eğer ön-işlemede resize yapıldıysa, tespit koordinatları
+        # küçültülmüş görüntüye göre. Orijinal boyuta geri dönüştür.
+        # Tüm kutular tek vektörel işlemle ölçeklenir (DetectionBatch.scale).
+        # Ölçek, kareyle birlikte ön-işleme adımından gelir (thread'li
+        # modda preprocessor bir sonraki kareyi işliyor olabilir)
+        if scale != 1.0:
+            detections = detections.scale(scale)
+
+        # === Adım 4: Son-İşleme (NMS) ===
+        # Güven filtresi → boyut/oran filtresi → NMS
+        detections = self._postprocessor.process(detections)
+
+        # === Adım 5: Görselleştirme ===
+        # Bounding box + güven etiketi + bilgi paneli → orijinal frame üzerine
+        # (çizimli kareyi kullanan yoksa atlanır — bkz. _draw_output)
+        output = frame
+        if self._draw_output:
+            output = self._visualizer.draw(
+                frame, detections, self._fps_counter.fps,
+                inplace=self._draw_inplace,
+            )
 
+        # === Adım 6: Frame Örnekleme (Opsiyonel) ===
+        # Tespit içeren kareleri belirli aralıklarla diske kaydeder
+        if self._sampler:
+            self._sampler.process(
+                frame_number=frame_number,
+                raw_frame=frame,             # Orijinal (çizimsiz) kare
+                annotated_frame=output,      # Çizim yapılmış kare
+                detections=detections,
+            )
+
+        # === Adım 7: İstatistik Kaydı (Opsiyonel) ===
+        # Güven skorları ve FPS değerini kare bazlı kaydet
+        if self._reporter:
+            # Güven skorları doğrudan batch dizisinden alınır —
+            # Detection nesnesi üretilmez
+            confidences = detections.confidences.tolist()
+            self._reporter.record_frame(
+                frame_number=frame_number,
+                detection_count=len(detections),
+                confidences=confidences,
+                fps=self._fps_counter.fps,
+            )
+
+        # === Adım 8: Ekrana Gösterme ===
+        # Başsız çalışmada (show_display=False) pencere ve tuş kontrolü
+        # yoktur — döngü video sonu veya Ctrl+C ile biter
+        if not self._config.show_display:
+            return True
+
+        cv2.imshow(self._window_name, output)
+
+        # --- Çıkış Kontrolü ---
+        # waitKey(1): 1ms bekle ve tuş basımını kontrol et
+        # 0xFF mask: Yalnızca ASCII değeri al (platform uyumluluğu)
+        key = cv2.waitKey(1) & 0xFF
+        return key != self._quit_code
+
+    def _prepared_frames(self) -> Iterator[PreparedFrame]:
+        """
+        Kareleri sırayla okuyup ön-işler (ana thread'de).
+
+        frame_stride > 1 ise işlenen her kareden sonra stride - 1 kare
+        kaynağın skip_frames() metoduyla çözülmeden atlanır (arka plan
+        okumada atlamayı okuyucu thread yapar). Kare numarası
+        atlanan kareleri de sayar — örnekleme ve rapor kaynak videodaki
+        gerçek kare numarasını görür.
+
+        Yields:
+            (kaynak kare numarası, orijinal kare, ön-işlenmiş kare,
+            ölçek faktörü) dörtlüleri.
+        """
+        skip = self._config.frame_stride - 1
+        frame_number = 0
         while True:
-            # --- Kare Okuma ---
             frame = self._source.read_frame()
             if frame is None:
-                # Video sonu veya kamera bağlantısı koptu
-                logger.info("Video sonu (toplam %d kare işlendi).", frame_count)
-                break
-
-            # FPS sayacını güncelle (kayan ortalama hesabı için)
-            self._fps_counter.tick()
-            frame_count += 1
-
-            # === Adım 1: Ön-İşleme ===
-            # Resize + görüntü iyileştirme → dedektör için hazırlık
+                return
+            frame_number += 1
             processed = self._preprocessor.process(frame)
+            yield frame_number, frame, processed, self._preprocessor.scale_factor
+            if skip:
+                frame_number += self._source.skip_frames(skip)
 
-            # === Adım 2: Tespit ===
-            # HOG + SVM ile yaya tespiti → ham tespitler
-            detections = self._detector.detect(processed)
+    def _prepared_frames_threaded(self) -> Iterator[PreparedFrame]:
+        """
+        Kareleri arka plan thread'inde okuyup ön-işler.
 
-            # === Adım 3: Koordinat Ölçekleme ===
-            # Eğer ön-işlemede resize yapıldıysa, tespit koordinatları
-            # küçültülmüş görüntüye göre. Orijinal boyuta geri dönüştür.
-            scale = self._preprocessor.scale_factor
-            if scale != 1.0:
-                detections = [d.scale(scale) for d in detections]
+        Ön-işleme (resize, CLAHE, sharpen) bir sonraki kare için çalışırken
+        ana thread mevcut karede tespit/çizim yapar. OpenCV çağrıları GIL'i
+        bıraktığı için iki adım çok çekirdekte gerçekten eş zamanlı ilerler.
+        Pencere (imshow/waitKey) ana thread'de kalır.
 
-            # === Adım 4: Son-İşleme (NMS) ===
-            # Güven filtresi → boyut/oran filtresi → NMS
-            detections = self._postprocessor.process(detections)
+        Sınırlı kuyruk (_PREPARED_QUEUE_SIZE) bellek kullanımını sabitler.
+        Preprocessor yalnızca bu thread'den çağrılır; iç tamponları
+        thread'ler arasında paylaşılmaz (dönen dizi her karede yenidir).
 
-            # === Adım 5: Görselleştirme ===
-            # Bounding box + güven etiketi + bilgi paneli → orijinal frame üzerine
-            output = self._visualizer.draw(
-                frame, detections, self._fps_counter.fps
-            )
+        Yields:
+            _prepared_frames() ile aynı dörtlüler.
 
-            # === Adım 6: Frame Örnekleme (Opsiyonel) ===
-            # Tespit içeren kareleri belirli aralıklarla diske kaydeder
-            if self._sampler:
-                self._sampler.process(
-                    frame_number=frame_count,
-                    raw_frame=frame,             # Orijinal (çizimsiz) kare
-                    annotated_frame=output,      # Çizim yapılmış kare
-                    detections=detections,
-                )
-
-            # === Adım 7: İstatistik Kaydı (Opsiyonel) ===
-            # Güven skorları ve FPS değerini kare bazlı kaydet
-            if self._reporter:
-                confidences = [d.confidence for d in detections]
-                self._reporter.record_frame(
-                    frame_number=frame_count,
-                    detection_count=len(detections),
-                    confidences=confidences,
-                    fps=self._fps_counter.fps,
-                )
-
-            # === Adım 8: Ekrana Gösterme ===
-            cv2.imshow(self._config.display_window_name, output)
-
-            # --- Çıkış Kontrolü ---
-            # waitKey(1): 1ms bekle ve tuş basımını kontrol et
-            # 0xFF mask: Yalnızca ASCII değeri al (platform uyumluluğu)
-            key = cv2.waitKey(1) & 0xFF
-            if key == ord(self._config.quit_key):
-                logger.info("Kullanıcı tarafından durduruldu.")
-                break
+        Raises:
+            Okuma/ön-işleme thread'inde oluşan hata aynen yeniden fırlatılır.
+        """
+        jobs: "queue.Queue[Optional[PreparedFrame]]" = queue.Queue(
+            maxsize=_PREPARED_QUEUE_SIZE
+        )
+        stop = threading.Event()
+        errors: List[BaseException] = []
+
+        def put(item: Optional[PreparedFrame]) -> bool:
+            # Durdurma istenirse beklemeyi bırak (tüketici artık almıyor)
+            while not stop.is_set():
+                try:
+                    jobs.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def worker() -> None:
+            try:
+                for item in self._prepared_frames():
+                    if not put(item):
+                        return
+            except BaseException as exc:  # Hata ana thread'e taşınır
+                errors.append(exc)
+            put(None)
+
+        thread = threading.Thread(target=worker, name="preprocess", daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = jobs.get()
+                if item is None:
+                    if errors:
+                        raise errors[0]
+                    return
+                yield item
+        finally:
+            stop.set()
+            thread.join()
 
     def _generate_report(self) -> None:
         """
@@ -288,8 +510,8 @@ class DetectionPipeline:
         output_path = self._config.visualization.output_path
         output_dir = os.path.dirname(output_path)
 
-        # Çıktı dizini yoksa oluştur
-        if output_dir and not os.path.exists(output_dir):
+        # Çıktı dizini yoksa oluştur (exist_ok → ayrı exists() kontrolü gerekmez)
+        if output_dir:
             os.makedirs(output_dir, exist_ok=True)
 
         # Visualizer'a yazıcı kur (FPS ve boyut video kaynağından alınır)
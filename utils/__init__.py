@@ -1,7 +1,37 @@
 # Utils Package
-from utils.logger import get_logger
-from utils.fps_counter import FPSCounter
-from utils.frame_sampler import FrameSampler
-from utils.report_generator import ReportGenerator
+#
+# Alt modüller ilk erişimde yüklenir (PEP 562). utils.frame_sampler cv2 ve
+# numpy'ı içe aktarır; paket düzeyinde doğrudan import edilseydi yalnızca
+# utils.logger isteyen modüller (ör. main.py --help) de OpenCV yükleme
+# süresini öderdi. "from utils import X" kullanımı değişmez.
+import importlib
 
-__all__ = ["get_logger", "FPSCounter", "FrameSampler", "ReportGenerator"]
+# Dışa aktarılan isim → tanımlandığı alt modül
+_EXPORTS = {
+    "get_logger": "utils.logger",
+    "FPSCounter": "utils.fps_counter",
+    "FrameSampler": "utils.frame_sampler",
+    "ReportGenerator": "utils.report_generator",
+    "configure_opencv": "utils.opencv_runtime",
+    "set_opencv_threads": "utils.opencv_runtime",
+}
+
+__all__ = [
+    "get_logger", "FPSCounter", "FrameSampler", "ReportGenerator",
+    "configure_opencv", "set_opencv_threads",
+]
+
+
+def __getattr__(name):
+    """Dışa aktarılan ismi ilk erişimde alt modülünden yükler."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Sonraki erişimler doğrudan modül sözlüğünden
+    return value
+
+
+def __dir__():
+    """dir(utils) tembel yüklenen isimleri de listeler."""
+    return sorted(set(globals()) | set(__all__))
@@ -44,14 +44,26 @@ class FPSCounter:
         self._timestamps: deque[float] = deque(maxlen=window_size)
         self._fps: float = 0.0
 
-    def tick(self) -> None:
+    def tick(self, count: int = 1) -> None:
         """
-        Yeni bir kare işlendiğinde çağrılır.
+        Yeni kare(ler) işlendiğinde çağrılır.
 
         time.perf_counter() kullanılır — en yüksek çözünürlüklü
         monoton zamanlayıcı (nanosaniye hassasiyeti).
+
+        Args:
+            count: Bu çağrıda tamamlanan kare sayısı. Toplu işlemede
+                (detect_batch) K kare birlikte biter; bir önceki zaman
+                damgasından bu yana geçen süre K kareye eşit dağıtılır.
+                Her kare için ayrı tick() çağrılırsa damgalar
+                mikrosaniye arayla düşer ve FPS gerçeğin çok üstünde çıkar.
         """
         now = time.perf_counter()
+        if count > 1 and self._timestamps:
+            # Ara kareler için eşit aralıklı zaman damgaları
+            last = self._timestamps[-1]
+            step = (now - last) / count
+            self._timestamps.extend(last + step * i for i in range(1, count))
         self._timestamps.append(now)
 
         # En az 2 zaman damgası varsa FPS hesapla
@@ -25,16 +25,31 @@ Dosya Adı Formatı:
 """
 
 import os
-from typing import List
+import queue
+import threading
+from typing import Optional, Sequence, Tuple
 
 import cv2
 import numpy as np
 
-from core.detection.base_detector import Detection
+from core.detection.base_detector import Detection, DetectionBatch
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# JPEG kalitesi: 90 (dosya boyutu / kalite dengesi)
+# Huffman optimizasyonu ve progressive kodlama açıkça kapalı: libjpeg-turbo'da
+# optimize=1 kodlamayı ~3 kat yavaşlatır (720p: ~6 ms → ~17 ms); debug
+# örnekleri için dosya boyutu kazancı (~%20) buna değmez
+_JPEG_PARAMS = [
+    cv2.IMWRITE_JPEG_QUALITY, 90,
+    cv2.IMWRITE_JPEG_OPTIMIZE, 0,
+    cv2.IMWRITE_JPEG_PROGRESSIVE, 0,
+]
+
+# threaded modda yazılmayı bekleyebilecek en fazla kare sayısı
+_WRITE_QUEUE_SIZE = 8
+
 
 class FrameSampler:
     """
@@ -46,6 +61,11 @@ class FrameSampler:
 
     Opsiyonel olarak orijinal (çizimsiz) kare de kaydedilebilir
     (eğitim verisi oluşturmak veya yeniden analiz için).
+
+    threaded=True ise JPEG kodlama + disk yazma arka plan thread'inde
+    yapılır (720p karede ~7 ms); ana döngü kaydetme kararını verip
+    kareyi kuyruğa bırakır. Kuyruktaki kareler close() ile diske yazılır.
+    Kareler kopyalanmaz — pipeline her karede yeni dizi kullanır.
     """
 
     def __init__(
@@ -54,6 +74,7 @@ class FrameSampler:
         sample_interval: int = 10,
         min_confidence_to_save: float = 0.0,
         save_raw: bool = False,
+        threaded: bool = False,
     ) -> None:
         """
         FrameSampler'ı başlatır ve çıktı dizinlerini oluşturur.
@@ -67,6 +88,7 @@ class FrameSampler:
                 0.0 → bu özellik devre dışı.
             save_raw: True ise çizimsiz orijinal frame de kaydedilir
                 (output_dir/raw/ altına).
+            threaded: True ise kareler arka plan thread'inde yazılır.
         """
         self._output_dir = output_dir
         # sample_interval en az 1 olmalı (sıfıra bölme koruması)
@@ -85,12 +107,23 @@ class FrameSampler:
         if save_raw:
             os.makedirs(os.path.join(output_dir, "raw"), exist_ok=True)
 
+        # Arka plan yazma kuyruğu — (dosya yolu, kare) işleri; None → kapanış
+        self._queue: "Optional[queue.Queue[Optional[Tuple[str, np.ndarray]]]]" = None
+        self._thread: Optional[threading.Thread] = None
+        if threaded:
+            self._queue = queue.Queue(maxsize=_WRITE_QUEUE_SIZE)
+            self._thread = threading.Thread(
+                target=self._write_loop, name="frame-sampler", daemon=True
+            )
+            self._thread.start()
+
         logger.info(
             "FrameSampler başlatıldı | Dizin: %s | Aralık: %d | "
-            "Raw kayıt: %s",
+            "Raw kayıt: %s | Arka plan yazma: %s",
             output_dir,
             sample_interval,
             save_raw,
+            threaded,
         )
 
     def process(
@@ -98,15 +131,15 @@ class FrameSampler:
         frame_number: int,
         raw_frame: np.ndarray,
         annotated_frame: np.ndarray,
-        detections: List[Detection],
+        detections: Sequence[Detection],
     ) -> None:
         """
         Kareyi değerlendirip gerekirse kaydeder.
 
         Karar mantığı:
             1. Tespit yoksa → hiçbir şey yapma
-            2. Yüksek güvenli tespit varsa → hemen kaydet
-            3. Periyodik interval'e ulaşıldıysa → kaydet
+            2. Periyodik interval'e ulaşıldıysa → kaydet
+            3. Yüksek güvenli tespit varsa → hemen kaydet
             4. Hiçbiri değilse → atla
 
         Args:
@@ -122,29 +155,40 @@ class FrameSampler:
         # Tespitli kare sayacını artır
         self._frames_with_detections += 1
 
-        # --- Yüksek güven kontrolü ---
-        # Karadeki en yüksek güven skorunu bul
-        max_conf = max(d.confidence for d in detections)
-        # min_confidence > 0 kontrolü → 0.0 ise bu özellik devre dışı
-        high_confidence = max_conf >= self._min_confidence > 0
-
         # --- Kaydetme kararı ---
-        # Ya yüksek güvenli tespit var → hemen kaydet
-        # Ya da periyodik interval'e ulaşıldı → periyodik kaydet
+        # Ya periyodik interval'e ulaşıldı → periyodik kaydet
+        # Ya da yüksek güvenli tespit var → hemen kaydet.
+        # Ucuz interval kontrolü önce yapılır; min_confidence 0.0 ise
+        # (özellik devre dışı) en yüksek güven hiç hesaplanmaz.
         should_save = (
-            high_confidence
-            or self._frames_with_detections % self._sample_interval == 0
+            self._frames_with_detections % self._sample_interval == 0
+            or (
+                self._min_confidence > 0
+                and self._max_confidence(detections) >= self._min_confidence
+            )
         )
 
         if should_save:
             self._save_frame(frame_number, raw_frame, annotated_frame, detections)
 
+    @staticmethod
+    def _max_confidence(detections: Sequence[Detection]) -> float:
+        """
+        Karedeki en yüksek güven skorunu döndürür.
+
+        DetectionBatch ise doğrudan güven dizisinin maksimumu alınır —
+        tespit başına Detection nesnesi üretilmez.
+        """
+        if isinstance(detections, DetectionBatch):
+            return float(detections.confidences.max())
+        return max(d.confidence for d in detections)
+
     def _save_frame(
         self,
         frame_number: int,
         raw_frame: np.ndarray,
         annotated_frame: np.ndarray,
-        detections: List[Detection],
+        detections: Sequence[Detection],
     ) -> None:
         """
         Kareyi JPEG olarak diske yazar.
@@ -163,15 +207,44 @@ class FrameSampler:
 
         # --- Çizimli kareyi kaydet ---
         annotated_path = os.path.join(self._output_dir, filename)
-        cv2.imwrite(annotated_path, annotated_frame, [cv2.IMWRITE_JPEG_QUALITY, 90])
+        self._write(annotated_path, annotated_frame)
 
         # --- Orijinal (çizimsiz) kareyi kaydet (opsiyonel) ---
         if self._save_raw:
             raw_path = os.path.join(self._output_dir, "raw", filename)
-            cv2.imwrite(raw_path, raw_frame, [cv2.IMWRITE_JPEG_QUALITY, 90])
+            self._write(raw_path, raw_frame)
 
         self._total_saved += 1
 
+    def _write(self, path: str, image: np.ndarray) -> None:
+        """Kareyi JPEG olarak yazar — threaded modda yazma kuyruğuna ekler."""
+        if self._queue is not None:
+            self._queue.put((path, image))  # Kuyruk doluysa bekler
+        else:
+            cv2.imwrite(path, image, _JPEG_PARAMS)
+
+    def _write_loop(self) -> None:
+        """Yazıcı thread döngüsü — None (kapanış işareti) gelene kadar yazar."""
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            path, image = job
+            try:
+                cv2.imwrite(path, image, _JPEG_PARAMS)
+            except cv2.error as exc:
+                logger.error("Örnek kare yazılamadı (%s): %s", path, exc)
+
+    def close(self) -> None:
+        """
+        Kuyrukta bekleyen kareleri diske yazar ve yazıcı thread'i durdurur.
+        threaded=False ise etkisizdir; tekrar çağrılabilir.
+        """
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
     @property
     def total_saved(self) -> int:
         """Toplam kaydedilen kare sayısını döndürür."""
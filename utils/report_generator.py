@@ -24,27 +24,34 @@ Kullanım:
     reporter.generate(video_source="video.mp4", ...)
 """
 
+import heapq
 import json
+import math
 import os
 import time
 from dataclasses import dataclass, field, asdict
-from typing import List, Dict
+from typing import List, Dict, Tuple
 
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Raporda detaylı listelenecek en yoğun kare sayısı
+_TOP_FRAME_COUNT = 5
+
 
 # =============================================================================
 # VERİ SINIFLARI
 # =============================================================================
-@dataclass
+@dataclass(slots=True)
 class FrameStats:
     """
     Tek bir karenin tespit istatistikleri.
 
-    Her işlenen kare için bir FrameStats nesnesi oluşturulur
-    ve ReportGenerator'ın listesine eklenir.
+    Yalnızca en yoğun kareler için FrameStats nesnesi tutulur
+    (ReportGenerator'ın top-k heap'i); diğer kareler yalnızca
+    kayan sayaçlara yansır.
+    slots=True → nesne başına __dict__ tutulmaz.
 
     Attributes:
         frame_number: Kare numarası (1'den başlar).
@@ -59,7 +66,7 @@ class FrameStats:
     fps: float
 
 
-@dataclass
+@dataclass(slots=True)
 class DetectionReport:
     """
     Video işleme sonuç raporu — JSON'a serileştirilir.
@@ -122,12 +129,34 @@ class ReportGenerator:
         """
         self._output_dir = output_dir
 
-        # --- Veri Toplama Listeleri ---
-        self._frame_stats: List[FrameStats] = []     # Kare başı istatistikler
-        self._all_confidences: List[float] = []       # Tüm güven skorları (düz liste)
-        self._all_fps: List[float] = []               # Tüm FPS değerleri
+        # --- En Yoğun Kareler (top-k min-heap) ---
+        # Öğeler: (tespit sayısı, -sıra no, FrameStats). Kökte en az tespitli
+        # (eşitlikte en geç gelen) kare bulunur — yeni kare yalnızca bundan
+        # kesin olarak yoğunsa yerine geçer. Bellek kare sayısından bağımsız
+        # O(k) kalır; tüm FrameStats listesi tutulmaz.
+        self._top_frames: List[Tuple[int, int, FrameStats]] = []
+
+        # --- Kayan Sayaçlar ---
+        self._processed_frames = 0         # İşlenen toplam kare sayısı
+        # record_frame() içinde güncellenir — generate() tüm kare listesini
+        # yeniden taramaz (uzun videolarda milyonlarca FrameStats)
+        self._frames_with_detections = 0   # Tespit içeren kare sayısı
+        self._total_detections = 0         # Toplam tespit sayısı
+
+        # --- Kayan Toplamlar (toplam, adet, min, max) ---
+        # Ortalama/min/max için tüm güven ve FPS değerlerini ayrı bir düz
+        # listede tutmak gerekmez — bellek kare sayısından bağımsız kalır
+        self._conf_sum = 0.0
+        self._conf_count = 0
+        self._conf_min = math.inf
+        self._conf_max = -math.inf
+        self._fps_sum = 0.0
+        self._fps_count = 0
+        self._fps_min = math.inf
+        self._fps_max = -math.inf
 
         # İşleme başlangıç zamanı (start() ile set edilir)
+        # time.perf_counter() — monoton; NTP/saat ayarı süreyi bozmaz
         self._start_time: float = 0.0
 
         # Çıktı dizinini oluştur
@@ -140,7 +169,7 @@ class ReportGenerator:
         Pipeline başlamadan hemen önce çağrılmalıdır —
         toplam işleme süresi bu zamandan itibaren hesaplanır.
         """
-        self._start_time = time.time()
+        self._start_time = time.perf_counter()
 
     def record_frame(
         self,
@@ -153,7 +182,8 @@ class ReportGenerator:
         Bir karenin istatistiklerini kaydeder.
 
         Bu metot pipeline'ın her karesinde çağrılır.
-        Veriler bellekte biriktirilir ve generate() çağrıldığında analiz edilir.
+        Sayaçlar ve toplamlar güncellenir; kare yalnızca en yoğun
+        kareler arasına giriyorsa FrameStats olarak saklanır.
 
         Args:
             frame_number: Kare numarası.
@@ -161,21 +191,42 @@ class ReportGenerator:
             confidences: Her tespite ait güven skorları.
             fps: Anlık FPS değeri (FPSCounter'dan).
         """
-        # FrameStats nesnesi oluştur ve listeye ekle
-        stats = FrameStats(
-            frame_number=frame_number,
-            detection_count=detection_count,
-            confidences=confidences,
-            fps=fps,
-        )
-        self._frame_stats.append(stats)
-
-        # Güven skorlarını düz listeye ekle (global istatistik için)
-        self._all_confidences.extend(confidences)
-
-        # FPS değerini kaydet (0 olanları hariç tut — başlangıç gecikmesi)
+        self._processed_frames += 1
+
+        # En yoğun kareler heap'ini güncelle — heap doluysa FrameStats
+        # yalnızca kare kökten yoğunsa oluşturulur
+        top = self._top_frames
+        if len(top) < _TOP_FRAME_COUNT or detection_count > top[0][0]:
+            stats = FrameStats(
+                frame_number=frame_number,
+                detection_count=detection_count,
+                confidences=confidences,
+                fps=fps,
+            )
+            entry = (detection_count, -self._processed_frames, stats)
+            if len(top) < _TOP_FRAME_COUNT:
+                heapq.heappush(top, entry)
+            else:
+                heapq.heapreplace(top, entry)
+
+        # Tespitli kare ve toplam tespit sayaçları
+        if detection_count > 0:
+            self._frames_with_detections += 1
+            self._total_detections += detection_count
+
+        # Güven skoru toplamlarını güncelle (global istatistik için)
+        if confidences:
+            self._conf_sum += sum(confidences)
+            self._conf_count += len(confidences)
+            self._conf_min = min(self._conf_min, min(confidences))
+            self._conf_max = max(self._conf_max, max(confidences))
+
+        # FPS toplamlarını güncelle (0 olanları hariç tut — başlangıç gecikmesi)
         if fps > 0:
-            self._all_fps.append(fps)
+            self._fps_sum += fps
+            self._fps_count += 1
+            self._fps_min = min(self._fps_min, fps)
+            self._fps_max = max(self._fps_max, fps)
 
     def generate(
         self,
@@ -206,11 +257,11 @@ class ReportGenerator:
             Oluşturulan rapor dosyasının yolu.
         """
         # Toplam işleme süresini hesapla
-        elapsed = time.time() - self._start_time if self._start_time else 0
+        elapsed = time.perf_counter() - self._start_time if self._start_time else 0
 
-        # Tespitli kare sayıları
-        frames_with = sum(1 for s in self._frame_stats if s.detection_count > 0)
-        total_det = sum(s.detection_count for s in self._frame_stats)
+        # Tespitli kare sayıları (record_frame() içinde biriktirilir)
+        frames_with = self._frames_with_detections
+        total_det = self._total_detections
 
         # DetectionReport nesnesini oluştur
         report = DetectionReport(
@@ -220,21 +271,21 @@ class ReportGenerator:
             video_fps=video_fps,
             total_video_frames=total_video_frames,
             # İşleme istatistikleri
-            total_processed_frames=len(self._frame_stats),
+            total_processed_frames=self._processed_frames,
             frames_with_detections=frames_with,
-            frames_without_detections=len(self._frame_stats) - frames_with,
+            frames_without_detections=self._processed_frames - frames_with,
             total_detections=total_det,
             # Güven dağılımı
-            avg_confidence=self._safe_avg(self._all_confidences),
-            min_confidence=min(self._all_confidences) if self._all_confidences else 0,
-            max_confidence=max(self._all_confidences) if self._all_confidences else 0,
+            avg_confidence=self._safe_avg(self._conf_sum, self._conf_count),
+            min_confidence=self._conf_min if self._conf_count else 0,
+            max_confidence=self._conf_max if self._conf_count else 0,
             # FPS performansı
-            avg_fps=self._safe_avg(self._all_fps),
-            min_fps=min(self._all_fps) if self._all_fps else 0,
-            max_fps=max(self._all_fps) if self._all_fps else 0,
+            avg_fps=self._safe_avg(self._fps_sum, self._fps_count),
+            min_fps=self._fps_min if self._fps_count else 0,
+            max_fps=self._fps_max if self._fps_count else 0,
             total_processing_time_sec=round(elapsed, 2),
-            # En yoğun 5 kare
-            top_detection_frames=self._get_top_frames(5),
+            # En yoğun kareler
+            top_detection_frames=self._get_top_frames(),
             # Konfigürasyon
             config_summary=config_summary or {},
         )
@@ -253,26 +304,22 @@ class ReportGenerator:
 
         return output_path
 
-    def _get_top_frames(self, n: int) -> List[Dict]:
+    def _get_top_frames(self) -> List[Dict]:
         """
-        En çok tespit içeren N kareyi döndürür.
+        En çok tespit içeren kareleri (en fazla _TOP_FRAME_COUNT) döndürür.
 
-        Tespit sayısına göre azalan sıralama yapılır.
+        Tespit sayısına göre azalan sırada döner; eşit tespit sayısında
+        kareler geliş (kare numarası) sırasını korur.
         Bu bilgi, kalabalık sahneleri veya sorunlu kareleri
         hızlıca bulmak için kullanılır.
 
-        Args:
-            n: Döndürülecek kare sayısı.
-
         Returns:
             FrameStats dict'lerinin listesi.
         """
-        sorted_stats = sorted(
-            self._frame_stats,
-            key=lambda s: s.detection_count,
-            reverse=True,  # Azalan sıralama (en yoğun ilk)
-        )
-        return [asdict(s) for s in sorted_stats[:n]]
+        # (tespit sayısı, -sıra no) anahtarı benzersizdir — FrameStats
+        # karşılaştırılmaz
+        top_stats = sorted(self._top_frames, reverse=True)
+        return [asdict(stats) for _, _, stats in top_stats]
 
     def _log_summary(self, report: DetectionReport) -> None:
         """
@@ -293,17 +340,18 @@ class ReportGenerator:
         logger.info("=" * 50)
 
     @staticmethod
-    def _safe_avg(values: list) -> float:
+    def _safe_avg(total: float, count: int) -> float:
         """
         Güvenli ortalama hesaplama.
-        Boş liste durumunda ZeroDivisionError yerine 0.0 döndürür.
+        Değer yoksa (count == 0) ZeroDivisionError yerine 0.0 döndürür.
 
         Args:
-            values: Sayısal değerler listesi.
+            total: Değerlerin toplamı.
+            count: Değer sayısı.
 
         Returns:
             Ortalama değer (4 ondalık basamağa yuvarlanmış) veya 0.0.
         """
-        if not values:
+        if not count:
             return 0.0
-        return round(sum(values) / len(values), 4)
+        return round(total / count, 4)